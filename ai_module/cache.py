@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List
+
+from . import jsonlib
+from .config import AIConfig
+from .schemas import Message
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(task_name: str, messages: List[Message], cfg: AIConfig) -> str:
+    """
+    Content-addressed key: same task, model settings and prompt -> same key.
+
+    Covers every AIConfig field that changes the response. Throughput and
+    retry settings (rps, parallelism, max_retries) and API keys do not.
+    """
+    payload = {
+        "task": task_name,
+        "provider": cfg.provider,
+        "model": cfg.model,
+        "temperature": cfg.temperature,
+        "max_tokens": cfg.max_tokens,
+        "json_only": cfg.json_only,
+        "messages": [[m.role, m.content] for m in messages],
+    }
+    # Always stdlib json here so keys don't change with the installed extras
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def load(cache_dir: str, key: str) -> Dict[str, Any] | None:
+    """Return the cached object, or None on a miss or an unreadable entry."""
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        with open(path, "rb") as f:
+            obj = jsonlib.loads(f.read())
+    except OSError:
+        return None
+    except ValueError as e:
+        # Corrupt or truncated file (JSONDecodeError / UnicodeDecodeError):
+        # treat as a miss so the provider is called and the entry rewritten
+        logger.warning("Ignoring unreadable AI cache entry %s: %s", key, e)
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def store(cache_dir: str, key: str, obj: Dict[str, Any]) -> None:
+    """Best-effort write: a failure is logged, never raised to the caller."""
+    directory = Path(cache_dir)
+    # Write to a temp file first so concurrent readers never see partial JSON
+    tmp = directory / f"{key}.{os.getpid()}.tmp"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(jsonlib.dumps(obj))
+        os.replace(tmp, directory / f"{key}.json")
+    except OSError as e:
+        logger.warning("Could not write AI cache entry %s: %s", key, e)
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
@@ -45,12 +45,12 @@ def main(argv: list[str] | None = None) -> int:
 
     args = parser.parse_args(argv)
 
-    cfg = AIConfig()
-    # Apply overrides
-    for k in ("provider", "model", "temperature", "parallelism", "rps"):
-        v = getattr(args, k, None)
-        if v is not None:
-            setattr(cfg, k, v)
+    cfg = AIConfig().with_overrides(
+        **{
+            k: getattr(args, k, None)
+            for k in ("provider", "model", "temperature", "parallelism", "rps")
+        }
+    )
     if getattr(args, "json_only", False):
         cfg.json_only = True
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from django.conf import settings as dj_settings  # type: ignore
 
 
@@ -54,7 +54,17 @@ class AIConfig:
     rps: float = float(_get("rps", 2.0))
     parallelism: int = int(_get("parallelism", 4))
     json_only: bool = _get_bool("json_only", True)
+    # Retries for transient provider errors (rate limits, 5xx, network)
+    max_retries: int = int(_get("max_retries", 2))
+    # Directory for the exact-match response cache (disabled when unset)
+    cache_dir: str | None = _get("cache_dir", None)
 
     # Provider-specific keys (for convenience; not required by callers)
     openai_api_key: str | None = dj_settings.OPENAI_API_KEY
     gemini_api_key: str | None = dj_settings.GEMINI_API_KEY
+
+    def with_overrides(self, **overrides) -> "AIConfig":
+        """Return a copy with every override that isn't None or "" applied."""
+        return replace(
+            self, **{k: v for k, v in overrides.items() if v is not None and v != ""}
+        )
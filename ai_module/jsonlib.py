@@ -0,0 +1,44 @@
+"""
+Shared JSON encode/decode helpers with an optional orjson speedup.
+
+orjson is installed via the "fast" extra (pip install ez-ram[fast]); without
+it everything falls back to the stdlib with identical output semantics:
+UTF-8, non-ASCII left unescaped. orjson's JSONDecodeError subclasses
+json.JSONDecodeError, so callers can catch the stdlib error either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def dumps(obj: Any, *, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Spaces per indent level, or None for compact output
+
+    Returns:
+        Encoded JSON document
+    """
+    # orjson only supports 2-space indentation
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import random
 from typing import Dict, Any, List
 
+from . import cache
 from .config import AIConfig
 from .schemas import Message
+from .providers.base import ProviderError
 from .registry import resolve_provider, get_task
 from .safety import ensure_json_obj, cap_len
 
+# Upper bound for a single backoff sleep, in seconds
+MAX_BACKOFF = 30.0
+
+
+async def _chat_with_retries(provider, messages: List[Message], cfg: AIConfig) -> str:
+    """Call the provider, retrying transient errors with jittered exponential backoff."""
+    attempt = 0
+    while True:
+        try:
+            return await provider.chat(messages, cfg)
+        except ProviderError as e:
+            if not e.retryable or attempt >= cfg.max_retries:
+                raise
+            # Jitter keeps concurrent callers from retrying in lockstep
+            delay = e.retry_after
+            if delay is None:
+                delay = 2**attempt + random.random()
+            await asyncio.sleep(min(delay, MAX_BACKOFF))
+            attempt += 1
+
 
 async def invoke_task(task, inp: Dict[str, Any], cfg: AIConfig) -> Dict[str, Any]:
     messages: List[Message] = task.build_messages(inp)
-    raw = await resolve_provider(cfg).chat(messages, cfg)
+
+    key = None
+    if cfg.cache_dir:
+        key = cache.cache_key(getattr(task, "name", ""), messages, cfg)
+        cached = cache.load(cfg.cache_dir, key)
+        if cached is not None:
+            return cached
+
+    raw = await _chat_with_retries(resolve_provider(cfg), messages, cfg)
     raw = cap_len(raw)
     obj = ensure_json_obj(raw) if cfg.json_only else {"text": raw}
-    return task.parse_output(obj) if cfg.json_only else obj
+    out = task.parse_output(obj) if cfg.json_only else obj
+
+    if key is not None:
+        cache.store(cfg.cache_dir, key, out)
+    return out
 
 
 async def invoke(task_name: str, inp: Dict[str, Any], cfg: AIConfig) -> Dict[str, Any]:
@@ -11,7 +11,6 @@ from .kernel import invoke_task
 async def run_batch(task_name: str, inputs: List[Dict[str, Any]], cfg: AIConfig) -> List[Any]:
     task = get_task(task_name)
     sem = asyncio.Semaphore(max(1, cfg.parallelism))
-    results: List[Any] = []
 
     async def one(inp: Dict[str, Any]):
         async with sem:
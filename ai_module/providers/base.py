@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Protocol, List
+import importlib
+from typing import Protocol, List, Tuple, Type
 
 from ..config import AIConfig
 from ..schemas import Message
@@ -11,6 +12,79 @@ class AIProvider(Protocol):
     async def chat(self, messages: List[Message], cfg: AIConfig) -> str: ...
 
 
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, server errors
+RETRYABLE_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+def _transport_errors() -> Tuple[Type[BaseException], ...]:
+    """Exception types that mean the request never got a response (network/timeout)."""
+    errors: List[Type[BaseException]] = [
+        asyncio.TimeoutError,
+        TimeoutError,
+        ConnectionError,
+    ]
+    # SDK transport errors; google-genai surfaces its network failures via httpx
+    for module, name in (
+        ("httpx", "TransportError"),
+        ("openai", "APIConnectionError"),
+        ("aiohttp", "ClientConnectionError"),
+    ):
+        try:
+            errors.append(getattr(importlib.import_module(module), name))
+        except (ImportError, AttributeError):
+            continue
+    return tuple(errors)
+
+
+# Status-less exceptions are only retried when they are one of these
+TRANSPORT_ERRORS = _transport_errors()
+
+
+class ProviderError(RuntimeError):
+    """
+    A failed provider API call.
+
+    `retryable` marks transient failures (rate limits, 5xx, network errors);
+    `retry_after` carries the server's Retry-After hint in seconds, if any.
+    """
+
+    def __init__(
+        self, message: str, *, retryable: bool = False, retry_after: float | None = None
+    ):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_exception(cls, prefix: str, exc: Exception) -> "ProviderError":
+        """
+        Classify an SDK exception as transient or not.
+
+        Exceptions with an HTTP status are retried for RETRYABLE_STATUS;
+        status-less ones only when they are transport errors. Anything else
+        (TypeError, bad request, auth misconfiguration) fails immediately.
+        """
+        status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+        if not isinstance(status, int):
+            status = None
+
+        headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+        try:
+            retry_after = float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            retry_after = None
+
+        return cls(
+            f"{prefix}: {exc}",
+            retryable=(
+                status in RETRYABLE_STATUS
+                if status is not None
+                else isinstance(exc, TRANSPORT_ERRORS)
+            ),
+            retry_after=retry_after,
+        )
+
+
 class _RPSLimiter:
     def __init__(self, rps: float):
         self._rps = max(0.0, rps)
@@ -29,5 +103,11 @@ class _RPSLimiter:
             self._last = asyncio.get_event_loop().time()
 
 
-__all__ = ["AIProvider", "_RPSLimiter"]
+__all__ = [
+    "AIProvider",
+    "ProviderError",
+    "RETRYABLE_STATUS",
+    "TRANSPORT_ERRORS",
+    "_RPSLimiter",
+]
 
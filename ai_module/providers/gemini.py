@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+from functools import lru_cache
 from typing import List
 
 from google import genai  # type: ignore
-from .base import AIProvider, _RPSLimiter
+from .base import AIProvider, ProviderError, _RPSLimiter
 from ..config import AIConfig
 from ..schemas import Message
 
 
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> genai.Client:
+    """Reuse one client (and its HTTP connection pool) per API key."""
+    return genai.Client(api_key=api_key)
+
+
 class GeminiProvider:
     def __init__(self, cfg: AIConfig):
         self.cfg = cfg
@@ -17,10 +24,10 @@ class GeminiProvider:
     async def chat(self, messages: List[Message], cfg: AIConfig) -> str:
         await self._limiter.pace()
 
-        api_key = cfg.api_key or cfg.gemini_api_key
+        api_key = cfg.gemini_api_key
         if not api_key:
             raise RuntimeError("GEMINI_API_KEY not set")
-        client = genai.Client(api_key=api_key)
+        client = _get_client(api_key)
         # generation_config = {
         #     "temperature": cfg.temperature,
         #     "response_mime_type": "application/json" if cfg.json_only else "text/plain",
@@ -40,7 +47,7 @@ class GeminiProvider:
                 ),
             )
         except Exception as e:  # pragma: no cover
-            raise RuntimeError(f"Gemini API error: {e}") from e
+            raise ProviderError.from_exception("Gemini API error", e) from e
 
         # Gemini SDK: resp.text contains the plain text content
         content = getattr(resp, "text", "")
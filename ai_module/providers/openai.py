@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 import asyncio
-from typing import List
+import weakref
+from typing import Dict, List
 
 from openai import AsyncOpenAI
-from .base import _RPSLimiter
+from .base import ProviderError, _RPSLimiter
 from ..config import AIConfig
 from ..schemas import Message
 
+# Clients are reused so requests share pooled keep-alive connections instead
+# of a new TCP+TLS handshake per call. The pool is bound to the event loop it
+# first runs on, so clients are cached per (running loop, api key).
+_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[str | None, AsyncOpenAI]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_client(api_key: str | None) -> AsyncOpenAI:
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        # Retries are handled by the kernel (see invoke_task)
+        client = clients[api_key] = AsyncOpenAI(api_key=api_key, max_retries=0)
+    return client
+
 
 class OpenAIProvider:
     def __init__(self, cfg: AIConfig):
@@ -16,7 +33,7 @@ class OpenAIProvider:
 
     async def chat(self, messages: List[Message], cfg: AIConfig) -> str:
         await self._limiter.pace()
-        client = AsyncOpenAI(api_key=cfg.openai_api_key)
+        client = _get_client(cfg.openai_api_key)
         # Prefer Chat Completions with JSON mode
         payload_msgs = [{"role": m.role, "content": m.content} for m in messages]
         try:
@@ -30,7 +47,7 @@ class OpenAIProvider:
                 text={"format": {"type": "json_object"}} if cfg.json_only else None,
             )
         except Exception as e:  # pragma: no cover
-            raise RuntimeError(f"OpenAI API error: {e}") from e
+            raise ProviderError.from_exception("OpenAI API error", e) from e
 
         content = resp.output[-1].content[0].text
         if not isinstance(content, str):
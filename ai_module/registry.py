@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Any
+import asyncio
+import weakref
+from typing import Callable, Dict, Any, Tuple
 
 from .config import AIConfig
 
@@ -8,15 +10,36 @@ from .config import AIConfig
 # Providers
 _PROVIDERS: Dict[str, Callable[[AIConfig], Any]] = {}
 
+# Provider instances are reused so calls share one rate limiter and client
+# setup. Like the OpenAI client pool, a provider's asyncio primitives are bound
+# to the loop they first run on, so instances are cached per running loop.
+_INSTANCES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[Tuple[str, str, float], Any]
+] = weakref.WeakKeyDictionary()
+
 
 def register_provider(name: str, factory: Callable[[AIConfig], Any]) -> None:
     _PROVIDERS[name] = factory
+    # Drop instances built by a previous factory for this name
+    for instances in list(_INSTANCES.values()):
+        for key in [k for k in instances if k[0] == name]:
+            del instances[key]
 
 
 def resolve_provider(cfg: AIConfig):
     if cfg.provider not in _PROVIDERS:
         raise ValueError(f"Unknown provider '{cfg.provider}'. Registered: {list(_PROVIDERS)}")
-    return _PROVIDERS[cfg.provider](cfg)
+    try:
+        instances = _INSTANCES.setdefault(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        # No running loop: nothing safe to share, build a fresh instance
+        return _PROVIDERS[cfg.provider](cfg)
+
+    key = (cfg.provider, cfg.model, cfg.rps)
+    provider = instances.get(key)
+    if provider is None:
+        provider = instances[key] = _PROVIDERS[cfg.provider](cfg)
+    return provider
 
 
 # Tasks
@@ -4,6 +4,8 @@ import json
 import re
 from typing import Any
 
+from . import jsonlib
+
 CODE_FENCE_RE = re.compile(r"^```(?:json)?\n|\n```$", re.MULTILINE)
 
 
@@ -14,7 +16,7 @@ def strip_code_fences(s: str) -> str:
 def ensure_json_obj(raw: str) -> dict[str, Any]:
     cleaned = strip_code_fences(raw)
     try:
-        obj = json.loads(cleaned)
+        obj = jsonlib.loads(cleaned)
     except json.JSONDecodeError as e:
         raise ValueError(f"Provider did not return valid JSON: {e}\nRaw: {raw[:500]}") from e
     if not isinstance(obj, dict):
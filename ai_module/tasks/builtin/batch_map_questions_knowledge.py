@@ -10,7 +10,7 @@ This is a TRUE batch operation - one prompt, one response, multiple question map
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from ...schemas import Message
 from ..base import AITask
@@ -78,39 +78,28 @@ class BatchMapQuestionsKnowledgeTask:
         knowledge_nodes = inp.get("knowledge_nodes", [])
 
         # Format knowledge nodes for the prompt
-        knowledge_list = []
-        for node in knowledge_nodes:
-            node_id = node.get("id") or node.get("element_id")
-            node_name = node.get("name", "")
-            knowledge_list.append(f"ID {node_id}: {node_name}")
-
         knowledge_text = (
-            "\n".join(knowledge_list)
-            if knowledge_list
+            "\n".join(
+                f"ID {node.get('id') or node.get('element_id')}: "
+                f"{node.get('name', '')}"
+                for node in knowledge_nodes
+            )
+            if knowledge_nodes
             else "No knowledge nodes provided"
         )
 
         # Format all questions
-        questions_text_parts = []
-        for q_idx, q_data in enumerate(questions, start=1):
-            question = q_data.get("question", "")
-            choices = q_data.get("choices", [])
-
-            choices_text = "\n".join(
-                [f"  {i + 1}. {choice}" for i, choice in enumerate(choices)]
-            )
-
-            question_block = (
-                f"Question {q_idx}:\n  Text: {question}\n  Choices:\n{choices_text}"
-            )
-            questions_text_parts.append(question_block)
-
-        all_questions_text = "\n\n".join(questions_text_parts)
+        all_questions_text = "\n\n".join(
+            BatchMapQuestionsKnowledgeTask._question_blocks(questions)
+        )
 
+        # The knowledge list is identical for every batch in a run, so it goes
+        # first: requests then share a stable prompt prefix that providers
+        # can cache, and only the question tail differs per batch.
         user_content = (
+            f"Available Knowledge Nodes:\n{knowledge_text}\n\n"
             f"Questions to Map ({len(questions)} total):\n\n"
-            f"{all_questions_text}\n\n"
-            f"Available Knowledge Nodes:\n{knowledge_text}"
+            f"{all_questions_text}"
         )
 
         return [
@@ -118,6 +107,20 @@ class BatchMapQuestionsKnowledgeTask:
             Message(role="user", content=user_content),
         ]
 
+    @staticmethod
+    def _question_blocks(questions: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield one formatted block per question for the prompt."""
+        for q_idx, q_data in enumerate(questions, start=1):
+            choices_text = "\n".join(
+                f"  {i}. {choice}"
+                for i, choice in enumerate(q_data.get("choices", []), start=1)
+            )
+            yield (
+                f"Question {q_idx}:\n"
+                f"  Text: {q_data.get('question', '')}\n"
+                f"  Choices:\n{choices_text}"
+            )
+
     @staticmethod
     def parse_output(obj: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -81,10 +81,11 @@ class MapQuestionKnowledgeTask:
         # Format choices
         choices_text = "\n".join([f"{i+1}. {choice}" for i, choice in enumerate(choices)])
         
+        # Shared knowledge list first so repeated calls reuse a cacheable prefix
         user_content = (
+            f"Available Knowledge Nodes:\n{knowledge_text}\n\n"
             f"Question: {question}\n\n"
-            f"Choices:\n{choices_text}\n\n"
-            f"Available Knowledge Nodes:\n{knowledge_text}"
+            f"Choices:\n{choices_text}"
         )
         
         return [
@@ -0,0 +1,15 @@
+"""
+Pytest bootstrap.
+
+core.settings loads its configuration through core.env.load_env, which needs a
+local .env (or Google Secret Manager). The .env file is never committed, so
+when it is missing the tests fall back to the placeholder values in
+.env.example instead of failing at collection.
+"""
+
+import os
+
+from core import env
+
+if not os.path.isfile(env.env_file):
+    env.env_file = os.path.join(env.BASE_DIR, ".env.example")
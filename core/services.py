@@ -9,7 +9,7 @@ Input = TypeVar("Input")
 Output = TypeVar("Output")
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceContext:
     """Optional ambient context that services can use (e.g., user, ram_id)."""
     user: Any | None = None
@@ -23,6 +23,8 @@ class BaseService(Generic[Input, Output]):
     Pattern:
       - Define __init__(self, inp: Input, ctx: ServiceContext | None = None)
       - Implement run(self) -> Output
+      - Services whose work is naturally async (e.g. AI calls) may override
+        run_async() and implement run() as asyncio.run(self.run_async())
       - Prefer small, pure methods; raise APIError for domain failures
     """
 
@@ -33,7 +35,12 @@ class BaseService(Generic[Input, Output]):
     def run(self) -> Output:  # pragma: no cover - abstract pattern
         raise NotImplementedError
 
+    async def run_async(self) -> Output:  # pragma: no cover - abstract pattern
+        # Deliberately no asyncio.to_thread(self.run) fallback: neomodel's
+        # connection is thread-local, so Neo4j-backed services run on a worker
+        # thread would silently open (and leak) a driver per thread.
+        raise NotImplementedError
+
     @classmethod
     def execute(cls, inp: Input, ctx: Optional[ServiceContext] = None) -> Output:
         return cls(inp, ctx=ctx).run()
-
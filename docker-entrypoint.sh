@@ -45,6 +45,12 @@ fi
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+# Install Neo4j constraints and indexes declared on the neomodel classes.
+# Idempotent; quiz_text uniqueness is what keeps concurrent MERGEs from
+# creating duplicate Quiz nodes.
+echo "Installing Neo4j constraints and indexes..."
+python manage.py install_labels
+
 # Collect static files
 echo "Collecting static files..."
 python manage.py collectstatic --noinput --clear
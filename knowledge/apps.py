@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class KnowledgeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'knowledge'
+
+    def ready(self):
+        # django_neomodel does not read a database name setting; apply it here
+        from neomodel import config
+
+        database_name = getattr(settings, "NEOMODEL_DATABASE_NAME", None)
+        if database_name:
+            config.DATABASE_NAME = database_name
@@ -38,3 +38,20 @@ class Knowledge(StructuredNode):
     # Reverse edges for convenience/introspection
     related_quizzes = RelationshipFrom("quiz.neo_models.Quiz", "RELATED_TO")
     related_choices = RelationshipFrom("quiz.neo_models.Choice", "RELATED_TO")
+
+    # neomodel hooks: question mapping caches the knowledge node list, so
+    # drop it whenever a Knowledge node is saved or deleted
+    def post_save(self):
+        _invalidate_knowledge_cache()
+
+    def post_delete(self):
+        _invalidate_knowledge_cache()
+
+
+def _invalidate_knowledge_cache():
+    # Imported lazily so loading the knowledge models doesn't pull in quiz
+    from quiz.services.question_knowledge_mapping_service import (
+        invalidate_knowledge_cache,
+    )
+
+    invalidate_knowledge_cache()
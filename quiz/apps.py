@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class QuizConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'quiz'
+
+    def ready(self):
+        # Load the neomodel classes so `manage.py install_labels` finds them
+        # and installs the Quiz.quiz_text unique constraint
+        from . import neo_models  # noqa: F401
@@ -9,18 +9,32 @@ Usage:
     python manage.py create_question_graph --from-predictions predictions.json --yes
 """
 
+import asyncio
 import json
+import logging
+import queue
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from django.core.management.base import BaseCommand, CommandError
+from neo4j.exceptions import TransientError
+from neomodel import db
 
+from ai_module import jsonlib
 from quiz.services.question_knowledge_mapping_service import (
     QuestionKnowledgeMappingService,
 )
 from quiz.services.batch_question_mapping_service import BatchQuestionMappingService
 from quiz.services.neo4j_quiz_service import Neo4jQuizService
 
+logger = logging.getLogger(__name__)
+
+# Retries per write chunk for transient Neo4j errors (deadlocks, leader switches)
+WRITE_RETRIES = 3
+
 
 class Command(BaseCommand):
     """
@@ -45,7 +59,10 @@ class Command(BaseCommand):
             "--file",
             type=str,
             default=None,
-            help="Path to JSON file containing questions with {question: str, choices: [str, ...]}",
+            help=(
+                "Path to JSON file containing questions with "
+                "{question: str, choices: [str, ...], correct_answers: [str, ...]}"
+            ),
         )
         parser.add_argument(
             "--labels",
@@ -107,6 +124,23 @@ class Command(BaseCommand):
             default=2.0,
             help="Requests per second limit for AI provider (default: 2.0)",
         )
+        parser.add_argument(
+            "--write-batch-size",
+            type=int,
+            default=100,
+            help="Number of question graphs written per Neo4j transaction (default: 100)",
+        )
+        parser.add_argument(
+            "--write-workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of concurrent Neo4j write transactions (default: 1). "
+                "Concurrent chunks share Knowledge nodes and may deadlock, and "
+                "need the Quiz.quiz_text constraint from `manage.py "
+                "install_labels` to avoid duplicate quizzes."
+            ),
+        )
 
     def handle(self, *args, **options):
         """Execute the command."""
@@ -126,8 +160,8 @@ class Command(BaseCommand):
             raise CommandError(f"Predictions file not found: {pred_path}")
 
         # Load predictions
-        with open(pred_path, "r", encoding="utf-8") as f:
-            aggregated: List[Dict[str, Any]] = json.load(f)
+        with open(pred_path, "rb") as f:
+            aggregated: List[Dict[str, Any]] = jsonlib.loads(f.read())
 
         if not isinstance(aggregated, list) or not aggregated:
             raise CommandError("Predictions must be a non-empty JSON list.")
@@ -157,12 +191,12 @@ class Command(BaseCommand):
             return
 
         # Write to Neo4j
-        created = self._write_to_neo4j(aggregated)
+        created, failed = self._write_to_neo4j(aggregated, options)
 
         self.stdout.write(self.style.SUCCESS("\nWrite complete from predictions."))
         self.stdout.write(
             json.dumps(
-                {"created": created, "total": len(aggregated)},
+                {"created": created, "failed": failed, "total": len(aggregated)},
                 ensure_ascii=False,
                 indent=2,
             )
@@ -176,8 +210,8 @@ class Command(BaseCommand):
             raise CommandError(f"Input file not found: {input_path}")
 
         # Load questions
-        with open(input_path, "r", encoding="utf-8") as f:
-            items: List[Dict[str, Any]] = json.load(f)
+        with open(input_path, "rb") as f:
+            items: List[Dict[str, Any]] = jsonlib.loads(f.read())
             if not isinstance(items, list):
                 items = items.get("quizzes", [])
 
@@ -221,8 +255,8 @@ class Command(BaseCommand):
         aggregated = self._process_batch(items, knowledge_nodes, options)
 
         # Dump all predictions for review
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(aggregated, f, ensure_ascii=False, indent=2)
+        with open(out_path, "wb") as f:
+            f.write(jsonlib.dumps(aggregated, indent=2))
 
         self.stdout.write(self.style.SUCCESS("\nPredictions written for review:"))
         self.stdout.write(f"  {out_path}")
@@ -246,12 +280,12 @@ class Command(BaseCommand):
             return
 
         # Write all to Neo4j
-        created = self._write_to_neo4j(aggregated)
+        created, failed = self._write_to_neo4j(aggregated, options)
 
         self.stdout.write(self.style.SUCCESS("\nWrite complete."))
         self.stdout.write(
             json.dumps(
-                {"created": created, "total": len(aggregated)},
+                {"created": created, "failed": failed, "total": len(aggregated)},
                 ensure_ascii=False,
                 indent=2,
             )
@@ -263,26 +297,16 @@ class Command(BaseCommand):
         knowledge_nodes: List[Dict[str, Any]],
         options: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
-        """Process questions in batches (parallel processing)."""
+        """Process questions in batches, running up to `parallelism` batches concurrently."""
         batch_size = options.get("batch_size", 10)
-        parallelism = options.get("parallelism", 5)
-        rps = options.get("rps", 2.0)
-
-        all_results: List[Dict[str, Any]] = []
 
-        # Process in batches
+        # Prepare batch inputs (filter out invalid questions)
+        batches: List[Tuple[int, int, List[Dict[str, Any]]]] = []
         for batch_start in range(0, len(items), batch_size):
             batch_end = min(batch_start + batch_size, len(items))
-            batch_items = items[batch_start:batch_end]
 
-            self.stdout.write(
-                f"Processing batch {batch_start // batch_size + 1} "
-                f"(questions {batch_start + 1}-{batch_end})..."
-            )
-
-            # Prepare batch input
             questions_data = []
-            for item in batch_items:
+            for item in items[batch_start:batch_end]:
                 question = (item or {}).get("question")
                 choices = (item or {}).get("choices") or []
 
@@ -293,51 +317,190 @@ class Command(BaseCommand):
                     {
                         "question": question,
                         "choices": choices,
+                        "correct_answers": item.get("correct_answers") or [],
                     }
                 )
 
-            # Use batch service
-            try:
-                batch_input = {
-                    "questions": questions_data,
-                    "knowledge_nodes": knowledge_nodes,
-                    "ai_provider": options.get("ai_provider"),
-                    "ai_model": options.get("ai_model"),
-                    "parallelism": parallelism,
-                    "rps": rps,
-                }
-
-                batch_results = BatchQuestionMappingService.execute(batch_input)
-                all_results.extend(batch_results)
+            # Nothing valid to map: don't spend an AI call on an empty batch
+            if not questions_data:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Skipping questions {batch_start + 1}-{batch_end}: "
+                        "no valid questions in batch"
+                    )
+                )
+                continue
+
+            batches.append((batch_start, batch_end, questions_data))
+
+        batch_results = asyncio.run(
+            self._run_batches(batches, knowledge_nodes, options)
+        )
 
+        # gather() preserves batch order, so results stay in input order
+        return [result for results in batch_results for result in results]
+
+    async def _run_batches(
+        self,
+        batches: List[Tuple[int, int, List[Dict[str, Any]]]],
+        knowledge_nodes: List[Dict[str, Any]],
+        options: Dict[str, Any],
+    ) -> List[List[Dict[str, Any]]]:
+        """Run all batches on one event loop, bounded by a semaphore."""
+        parallelism = options.get("parallelism", 5)
+        rps = options.get("rps", 2.0)
+        sem = asyncio.Semaphore(max(1, parallelism))
+
+        async def run_one(
+            batch_no: int,
+            batch_start: int,
+            batch_end: int,
+            questions_data: List[Dict[str, Any]],
+        ) -> List[Dict[str, Any]]:
+            batch_input = {
+                "questions": questions_data,
+                "knowledge_nodes": knowledge_nodes,
+                "ai_provider": options.get("ai_provider"),
+                "ai_model": options.get("ai_model"),
+                "parallelism": parallelism,
+                "rps": rps,
+            }
+
+            async with sem:
                 self.stdout.write(
-                    f"  ✓ Completed {len(batch_results)}/{len(questions_data)} questions"
+                    f"Processing batch {batch_no} "
+                    f"(questions {batch_start + 1}-{batch_end})..."
                 )
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"  ✗ Batch failed: {e}"))
+                try:
+                    batch_results = await BatchQuestionMappingService(
+                        batch_input
+                    ).run_async()
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(f"  ✗ Batch {batch_no} failed: {e}")
+                    )
+                    return []
 
-        return all_results
+            self.stdout.write(
+                f"  ✓ Batch {batch_no}: completed "
+                f"{len(batch_results)}/{len(questions_data)} questions"
+            )
+            return batch_results
 
-    def _write_to_neo4j(self, mappings: List[Dict[str, Any]]) -> int:
-        """Write all mappings to Neo4j."""
-        created = 0
+        return await asyncio.gather(
+            *(
+                run_one(batch_no, *batch)
+                for batch_no, batch in enumerate(batches, start=1)
+            )
+        )
 
+    def _write_to_neo4j(
+        self, mappings: List[Dict[str, Any]], options: Dict[str, Any]
+    ) -> Tuple[int, int]:
+        """
+        Write all mappings to Neo4j in chunked transactions.
+
+        Each chunk of `write_batch_size` mappings commits in its own
+        transaction, so a failing chunk rolls back only itself; it is
+        reported and the remaining chunks are still written.
+
+        Chunks are written sequentially by default. With `write_workers` > 1
+        they are written from that many threads; neomodel's connection is
+        thread-local, so each worker opens its own driver and closes it when
+        done. Concurrent chunks MERGE the same Knowledge nodes and can
+        deadlock each other, so only raise this for disjoint imports.
+
+        Returns:
+            Tuple of (written, failed) mapping counts
+        """
+        batch_size = max(1, options.get("write_batch_size") or 100)
+        workers = max(1, options.get("write_workers") or 1)
+
+        valid: List[Dict[str, Any]] = []
         for idx, m in enumerate(mappings, start=1):
-            question_text = m.get("question", "")
-            choices_payload = m.get("choices", [])
-            qids = [int(x) for x in (m.get("question_knowledge_ids") or [])]
-
-            if not question_text or not choices_payload:
+            if not m.get("question", "") or not m.get("choices", []):
                 self.stdout.write(
                     self.style.WARNING(f"[{idx}] Skipping incomplete mapping: {m}")
                 )
                 continue
-
-            Neo4jQuizService.create_question_graph(
-                question_text=question_text,
-                choices=choices_payload,
-                question_knowledge_ids=qids,
+            valid.append(m)
+
+        chunks = [
+            (chunk_no, valid[start : start + batch_size])
+            for chunk_no, start in enumerate(range(0, len(valid), batch_size), start=1)
+        ]
+        if not chunks:
+            return 0, 0
+
+        workers = min(workers, len(chunks))
+        if workers == 1:
+            results = [self._write_chunk_safely(no, chunk) for no, chunk in chunks]
+        else:
+            pending: queue.SimpleQueue = queue.SimpleQueue()
+            for item in chunks:
+                pending.put(item)
+
+            def worker() -> List[Tuple[int, int]]:
+                worker_results = []
+                try:
+                    while True:
+                        try:
+                            chunk_no, chunk = pending.get_nowait()
+                        except queue.Empty:
+                            return worker_results
+                        worker_results.append(
+                            self._write_chunk_safely(chunk_no, chunk)
+                        )
+                finally:
+                    # Close this thread's driver instead of leaking it
+                    db.close_connection()
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(worker) for _ in range(workers)]
+                results = [r for future in futures for r in future.result()]
+
+        written = sum(ok for ok, _ in results)
+        failed = sum(bad for _, bad in results)
+        if failed:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"{failed} mapping(s) in failed chunks were not written; "
+                    f"{written} were written."
+                )
             )
-            created += 1
+        return written, failed
+
+    def _write_chunk_safely(
+        self, chunk_no: int, chunk: List[Dict[str, Any]]
+    ) -> Tuple[int, int]:
+        """Write one chunk, reporting a failure instead of aborting the run."""
+        try:
+            return self._write_chunk(chunk), 0
+        except Exception as e:
+            logger.exception("Neo4j write chunk %d failed", chunk_no)
+            self.stdout.write(
+                self.style.ERROR(
+                    f"  ✗ Write chunk {chunk_no} ({len(chunk)} mappings) failed: {e}"
+                )
+            )
+            return 0, len(chunk)
 
-        return created
+    def _write_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """Write one chunk of mappings in a single transaction, retrying transient errors."""
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                with db.transaction:
+                    for m in chunk:
+                        Neo4jQuizService.create_question_graph(
+                            question_text=m["question"],
+                            choices=m["choices"],
+                            question_knowledge_ids=[
+                                int(x) for x in (m.get("question_knowledge_ids") or [])
+                            ],
+                        )
+                return len(chunk)
+            except TransientError:
+                if attempt == WRITE_RETRIES:
+                    raise
+                time.sleep(2**attempt + random.random())
+        return 0
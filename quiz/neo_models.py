@@ -5,7 +5,6 @@ from neomodel import (
     BooleanProperty,
     RelationshipTo,
     RelationshipFrom,
-    UniqueIdProperty,
 )
 
 
@@ -14,7 +13,7 @@ class Quiz(StructuredNode):
     A quiz question text that may relate to Knowledge and has Choices
     """
 
-    quiz_text = StringProperty(required=True)  # e.g., "She is ___ for class."
+    quiz_text = StringProperty(required=True, unique_index=True)  # e.g., "She is ___ for class."
 
     # Quiz suggestion engine fields
     difficulty_level = IntegerProperty(default=3)  # 1-5 scale (1=easiest, 5=hardest)
@@ -9,11 +9,21 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from ai_module.config import AIConfig
 from ai_module.kernel import invoke
 from core.services import BaseService
+from quiz.services.question_knowledge_mapping_service import normalize_answer
+
+logger = logging.getLogger(__name__)
+
+# Per-choice metadata normalized once per run:
+# (index, text, is_correct, answer_description)
+ChoiceMeta = Tuple[int, str, bool, str]
 
 
 class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any]]]):
@@ -34,6 +44,7 @@ class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any
                     "is_correct": true,
                     "answer_description": "ถูกต้อง เพราะประธาน **they** เป็นพหูพจน์ ต้องใช้โครงสร้าง __Do + subject + base verb__. กริยาหลักคงรูป: `Do they live near here?` ใช้ถามข้อเท็จจริงทั่วไปหรือความเป็นจริงในปัจจุบัน."
                 }],
+                "correct_answers": [str, ...],  # optional, for plain-string choices
             },
             ...
         ],
@@ -64,6 +75,15 @@ class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any
 
     def run(self) -> List[Dict[str, Any]]:
         """Execute batch question-knowledge mapping with TRUE batching (1 AI call for all questions)."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> List[Dict[str, Any]]:
+        """
+        Async variant of run() for callers that already own an event loop.
+
+        Lets several batches share one loop (e.g. under asyncio.gather)
+        instead of paying an asyncio.run() setup/teardown per batch.
+        """
         data = self.inp or {}
 
         # Extract inputs
@@ -80,15 +100,13 @@ class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any
             raise ValueError("'questions' must be a list")
 
         # Prepare AI config
-        cfg = AIConfig()
-        if ai_provider:
-            cfg.provider = ai_provider
-        if ai_model:
-            cfg.model = ai_model
+        cfg = AIConfig().with_overrides(provider=ai_provider, model=ai_model)
 
         # Prepare questions data (filter out invalid ones)
         valid_questions = []
-        question_metadata = []  # Store metadata separately
+        # Metadata is normalized to (question, [ChoiceMeta, ...]) up front so
+        # the per-mapping normalization does no dict lookups.
+        question_metadata: List[Tuple[str, List[ChoiceMeta]]] = []
 
         for q_data in questions:
             question = q_data.get("question", "")
@@ -98,18 +116,30 @@ class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any
                 # Skip invalid questions
                 continue
 
+            correct_answers = {
+                normalize_answer(a) for a in q_data.get("correct_answers") or []
+            }
+            choice_meta = [
+                self._choice_meta(position, choice, correct_answers)
+                for position, choice in enumerate(choices, start=1)
+            ]
+
             valid_questions.append(
                 {
                     "question": question,
-                    "choices": [f"{c.get('text', '')}" for c in choices],
+                    "choices": [meta[1] for meta in choice_meta],
                 }
             )
-
-            question_metadata.append(q_data)
+            question_metadata.append((question, choice_meta))
 
         if not valid_questions:
             return []
 
+        # Nothing to map against: skip the AI round trip entirely
+        if not knowledge_nodes:
+            logger.warning("No knowledge nodes available; skipping AI mapping")
+            return [self._normalize_mapping({}, meta) for meta in question_metadata]
+
         # Prepare input for TRUE batch AI task (all questions in one prompt)
         batch_input = {
             "questions": valid_questions,
@@ -117,71 +147,97 @@ class BatchQuestionMappingService(BaseService[Dict[str, Any], List[Dict[str, Any
         }
 
         # Make ONE AI call for ALL questions
-        import logging
-
-        logging.getLogger(__name__).info(
-            f"Sending {len(valid_questions)} questions in ONE batch AI request"
+        logger.info(
+            "Sending %d questions in ONE batch AI request", len(valid_questions)
         )
 
-        result = asyncio.run(invoke("batch_map_questions_knowledge", batch_input, cfg))
+        result = await invoke("batch_map_questions_knowledge", batch_input, cfg)
 
-        with open("ai_response.json", "w") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # Raw AI response dump for debugging only; unique name per call so
+        # concurrent batches/workers never clobber each other.
+        if os.getenv("DEBUG_AI_RESPONSE"):
+            path = f"ai_response_{os.getpid()}_{time.time_ns()}.json"
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
 
         # Extract mappings from the single response
         mappings = result.get("mappings", [])
 
-        logging.getLogger(__name__).info(
-            f"Received {len(mappings)} mappings from AI in single response"
-        )
-
-        # Normalize results
-        normalized_results = []
-        for mapping in mappings:
-            question_index = mapping.get("question_index", 0)
-
-            # question_index is 1-based, convert to 0-based for array access
-            array_index = question_index - 1
+        logger.info("Received %d mappings from AI in single response", len(mappings))
 
-            metadata = question_metadata[array_index]
+        # question_index is 1-based; key metadata by it explicitly so
+        # out-of-order, missing or out-of-range indices cannot misattribute
+        meta_by_index = {i: meta for i, meta in enumerate(question_metadata, start=1)}
 
-            normalized = self._normalize_mapping(
-                mapping=mapping,
-                question=metadata,
+        # Normalize results in a single pass; unknown indices are dropped
+        normalize = self._normalize_mapping
+        normalized_results = [
+            normalize(
+                mapping=mapping, question=meta_by_index[mapping.get("question_index")]
+            )
+            for mapping in mappings
+            if mapping.get("question_index") in meta_by_index
+        ]
+        skipped = len(mappings) - len(normalized_results)
+        if skipped:
+            logger.warning(
+                "Ignoring %d mapping(s) with unknown question_index", skipped
             )
-            normalized_results.append(normalized)
 
         return normalized_results
 
+    @staticmethod
+    def _choice_meta(
+        position: int, choice: Any, correct_answers: Set[str]
+    ) -> ChoiceMeta:
+        """
+        Normalize one input choice to a ChoiceMeta tuple.
+
+        Choices may be plain strings (as in the create_question_graph input
+        file, with correctness taken from the question's correct_answers,
+        given as normalize_answer keys) or dicts with
+        index/text/is_correct/answer_description.
+        """
+        if isinstance(choice, str):
+            return (position, choice, normalize_answer(choice) in correct_answers, "")
+        return (
+            choice.get("index", 0),
+            choice.get("text", ""),
+            choice.get("is_correct", False),
+            choice.get("answer_description", ""),
+        )
+
     def _normalize_mapping(
         self,
         mapping: Dict[str, Any],
-        question: Dict[str, Any],
+        question: Tuple[str, List[ChoiceMeta]],
     ) -> Dict[str, Any]:
         """
         Normalize the AI mapping output with additional metadata.
 
-        Ensures all choices are present with correct structure and metadata.
+        Ensures all choices are present with correct structure and metadata;
+        choices the AI did not return get empty knowledge_ids.
         """
-
-        output: Dict[str, Any] = {
-            "question": question.get("question", ""),
+        question_text, choices = question
+        found_ids = [
+            found.get("knowledge_ids", []) if found else []
+            for found in mapping.get("choices") or []
+        ]
+        n_found = len(found_ids)
+
+        return {
+            "question": question_text,
             "question_knowledge_ids": (mapping.get("question_knowledge_ids") or []),
-            "choices": [],
-        }
-
-        # Process each choice
-        for choice, found in zip(
-            question.get("choices", []), mapping.get("choices", [])
-        ):
-            output["choices"].append(
+            "choices": [
                 {
-                    "index": choice.get("index", 0),
-                    "text": choice.get("text", ""),
-                    "knowledge_ids": found.get("knowledge_ids", []) if found else [],
-                    "is_correct": choice.get("is_correct", False),
-                    "answer_description": choice.get("answer_description", ""),
+                    "index": index,
+                    "text": text,
+                    "knowledge_ids": found_ids[pos] if pos < n_found else [],
+                    "is_correct": is_correct,
+                    "answer_description": answer_description,
                 }
-            )
-
-        return output
+                for pos, (index, text, is_correct, answer_description) in enumerate(
+                    choices
+                )
+            ],
+        }
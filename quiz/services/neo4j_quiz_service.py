@@ -8,6 +8,63 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from neomodel import db
+
+# Merge a whole quiz subgraph (quiz, choices, knowledge links) in one round trip.
+#
+# - The quiz is merged by quiz_text. Concurrent writers only avoid duplicate
+#   quizzes once the unique constraint from `manage.py install_labels` exists
+#   (docker-entrypoint.sh runs it). is_new comes from a lookup before the
+#   MERGE, so an existing quiz node is never written just to report it.
+# - Choices are merged through the quiz's HAS_CHOICE pattern, so a choice is
+#   only reused when it already belongs to this quiz. Unchanged choices are
+#   not rewritten, so re-imports don't take needless write locks; the
+#   comparison is null-safe, so choices missing a stored value get updated.
+# - Knowledge ids are the numeric part of the element_id, i.e. id(k).
+# - Unit subqueries keep the quiz row alive when a list parameter is empty.
+CREATE_QUESTION_GRAPH_QUERY = """
+OPTIONAL MATCH (existing:Quiz {quiz_text: $question_text})
+WITH existing IS NULL AS is_new
+MERGE (q:Quiz {quiz_text: $question_text})
+ON CREATE SET
+    q.difficulty_level = 3,
+    q.quiz_type = "multiple_choice"
+WITH q, is_new
+CALL {
+    WITH q
+    UNWIND $question_knowledge_ids AS kid
+    MATCH (k:Knowledge) WHERE id(k) = kid
+    MERGE (q)-[:RELATED_TO]->(k)
+}
+CALL {
+    WITH q
+    UNWIND $choices AS c
+    MERGE (q)-[:HAS_CHOICE]->(ch:Choice {choice_text: c.text})
+    WITH ch, c,
+        coalesce(ch.is_correct = c.is_correct, false)
+        AND coalesce(ch.answer_explanation, "") = coalesce(c.answer_explanation, "")
+        AS unchanged
+    FOREACH (_ IN CASE WHEN unchanged THEN [] ELSE [1] END |
+        SET ch.is_correct = c.is_correct,
+            ch.answer_explanation = c.answer_explanation
+    )
+    WITH ch, c
+    CALL {
+        WITH ch, c
+        UNWIND c.knowledge_ids AS kid
+        MATCH (k:Knowledge) WHERE id(k) = kid
+        MERGE (ch)-[:RELATED_TO]->(k)
+    }
+    RETURN collect({
+        element_id: elementId(ch),
+        text: ch.choice_text,
+        is_correct: ch.is_correct,
+        answer_explanation: ch.answer_explanation
+    }) AS choices
+}
+RETURN elementId(q) AS quiz_element_id, is_new, choices
+"""
+
 
 class Neo4jQuizService:
     """
@@ -27,7 +84,8 @@ class Neo4jQuizService:
         Create or merge a complete question graph in Neo4j.
 
         If a Quiz with the same quiz_text already exists, it will be merged
-        (updated with new relationships and choices).
+        (updated with new relationships and choices). The whole graph is
+        written with a single Cypher statement.
 
         Args:
             question_text: The quiz question text
@@ -37,125 +95,38 @@ class Neo4jQuizService:
                     "text": str,
                     "knowledge_ids": [int, ...],
                     "is_correct": bool,
-                    "answer_explanation": str
+                    "answer_description": str
                 }
             question_knowledge_ids: List of knowledge IDs related to the question
-            answer_description: Optional explanation for the answer
 
         Returns:
             Dict with created/merged node information
         """
-        # Import here to avoid circular import
-        from knowledge.neo_models import Knowledge
-        from quiz.neo_models import Quiz, Choice
-
-        # Check if Quiz with same quiz_text already exists
-        try:
-            existing_quiz = Quiz.nodes.filter(quiz_text=question_text).first()
-        except Quiz.DoesNotExist:
-            existing_quiz = None
-
-        if existing_quiz:
-            # Merge: use existing quiz
-            quiz = existing_quiz
-            is_new = False
-        else:
-            # Create new Quiz node
-            quiz = Quiz(quiz_text=question_text).save()
-            is_new = True
-
-        # Link quiz to knowledge nodes (avoid duplicates)
-        if question_knowledge_ids:
-            # Get existing knowledge relationships
-            existing_knowledge_ids = set()
-            for k in quiz.related_to.all():
-                kid = Neo4jQuizService._extract_numeric_id(k.element_id)
-                if kid:
-                    existing_knowledge_ids.add(kid)
-
-            # Add new knowledge relationships
-            for kid in question_knowledge_ids:
-                if kid in existing_knowledge_ids:
-                    continue  # Skip if already connected
-
-                try:
-                    # Find knowledge node by element_id
-                    knowledge_nodes = Knowledge.nodes.all()
-                    for k in knowledge_nodes:
-                        if Neo4jQuizService._extract_numeric_id(k.element_id) == kid:
-                            quiz.related_to.connect(k)
-                            break
-                except Exception:
-                    # Skip if knowledge node not found
-                    pass
-
-        # Get existing choices for this quiz
-        existing_choices_map = {}  # choice_text -> Choice node
-        for existing_choice in quiz.has_choice.all():
-            existing_choices_map[existing_choice.choice_text] = existing_choice
-
-        # Create or update Choice nodes and link them
-        created_choices = []
-        for choice_data in choices:
-            choice_text = choice_data.get("text", "")
-            is_correct = choice_data.get("is_correct", False)
-            knowledge_ids = choice_data.get("knowledge_ids", [])
-            choice_answer_description = choice_data.get("answer_description", "")
-
-            if not choice_text:
-                continue
-
-            # Check if choice already exists
-            if choice_text in existing_choices_map:
-                # Merge: update existing choice
-                choice = existing_choices_map[choice_text]
-                choice.is_correct = is_correct
-                choice.answer_explanation = choice_answer_description
-                choice.save()
-            else:
-                # Create new Choice node
-                choice = Choice(
-                    choice_text=choice_text,
-                    is_correct=is_correct,
-                    answer_explanation=choice_answer_description,
-                ).save()
-
-                # Link choice to quiz
-                quiz.has_choice.connect(choice)
-
-            # Get existing knowledge relationships for this choice
-            existing_choice_knowledge_ids = set()
-            for k in choice.related_to.all():
-                kid = Neo4jQuizService._extract_numeric_id(k.element_id)
-                if kid:
-                    existing_choice_knowledge_ids.add(kid)
-
-            # Link choice to knowledge nodes (avoid duplicates)
-            for kid in knowledge_ids:
-                if kid in existing_choice_knowledge_ids:
-                    continue  # Skip if already connected
-
-                try:
-                    knowledge_nodes = Knowledge.nodes.all()
-                    for k in knowledge_nodes:
-                        if Neo4jQuizService._extract_numeric_id(k.element_id) == kid:
-                            choice.related_to.connect(k)
-                            break
-                except Exception:
-                    # Skip if knowledge node not found
-                    pass
-
-            created_choices.append(
-                {
-                    "element_id": choice.element_id,
-                    "text": choice_text,
-                    "is_correct": is_correct,
-                    "answer_explanation": choice_answer_description,
-                }
-            )
+        choice_rows = [
+            {
+                "text": choice_data.get("text", ""),
+                "is_correct": bool(choice_data.get("is_correct")),
+                "answer_explanation": choice_data.get("answer_description") or "",
+                "knowledge_ids": Neo4jQuizService._numeric_ids(
+                    choice_data.get("knowledge_ids")
+                ),
+            }
+            for choice_data in choices
+            if choice_data.get("text", "")
+        ]
+
+        params = {
+            "question_text": question_text,
+            "question_knowledge_ids": Neo4jQuizService._numeric_ids(
+                question_knowledge_ids
+            ),
+            "choices": choice_rows,
+        }
+        results, _ = db.cypher_query(CREATE_QUESTION_GRAPH_QUERY, params)
+        quiz_element_id, is_new, created_choices = results[0]
 
         return {
-            "quiz_element_id": quiz.element_id,
+            "quiz_element_id": quiz_element_id,
             "quiz_text": question_text,
             "choices_count": len(created_choices),
             "choices": created_choices,
@@ -163,20 +134,11 @@ class Neo4jQuizService:
         }
 
     @staticmethod
-    def _extract_numeric_id(element_id: str) -> Optional[int]:
+    def _numeric_ids(ids: Optional[List[Any]]) -> List[int]:
         """
-        Extract numeric ID from Neo4j element_id format.
+        Keep only integer knowledge IDs, deduplicated in first-seen order.
 
-        Format: "4:uuid:numeric_id"
+        Anything else can never match id(k), and duplicates would only make
+        the query re-match and re-MERGE the same relationship.
         """
-        if not isinstance(element_id, str):
-            return None
-
-        parts = element_id.split(":")
-        if len(parts) >= 3:
-            try:
-                return int(parts[-1])
-            except (ValueError, IndexError):
-                pass
-
-        return None
+        return list(dict.fromkeys(kid for kid in ids or () if isinstance(kid, int)))
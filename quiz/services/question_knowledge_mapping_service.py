@@ -10,12 +10,49 @@ This service handles the business logic for:
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from neomodel import db
 
 from ai_module.config import AIConfig
 from ai_module.kernel import invoke
 from core.services import BaseService, ServiceContext
 
+logger = logging.getLogger(__name__)
+
+# Knowledge nodes change far less often than questions are mapped, so fetch
+# results are kept in-process for a few minutes, keyed by (labels, limit).
+# Knowledge.post_save/post_delete clear it; other edits wait out the TTL.
+KNOWLEDGE_CACHE_TTL = getattr(settings, "KNOWLEDGE_CACHE_TTL", 300)  # seconds
+
+_knowledge_cache: Dict[
+    Tuple[Tuple[str, ...], int], Tuple[float, List[Dict[str, Any]]]
+] = {}
+
+
+def invalidate_knowledge_cache() -> None:
+    """Drop cached knowledge node fetches (call after editing knowledge nodes)."""
+    _knowledge_cache.clear()
+
+
+def normalize_answer(answer: Any) -> str:
+    """Comparison key for answer text: case- and surrounding-whitespace-insensitive."""
+    return str(answer).strip().casefold()
+
+
+def _int_ids(values: Any) -> List[int]:
+    """Convert AI-returned ids to ints, skipping anything that isn't numeric."""
+    ids = []
+    for value in values or []:
+        try:
+            ids.append(int(value))
+        except (TypeError, ValueError):
+            logger.debug("Ignoring non-numeric knowledge id %r", value)
+    return ids
+
 
 class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]]):
     """
@@ -56,6 +93,15 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
 
     def run(self) -> Dict[str, Any]:
         """Execute the question-knowledge mapping."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> Dict[str, Any]:
+        """
+        Async variant of run() for callers that already own an event loop.
+
+        Mapping many questions from one loop avoids an asyncio.run()
+        setup/teardown per question.
+        """
         data = self.inp or {}
 
         # Extract inputs
@@ -82,8 +128,19 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
                 labels=knowledge_labels, limit=knowledge_limit
             )
 
+        # Nothing to map against: skip the AI round trip entirely
+        if not knowledge_nodes:
+            logger.warning("No knowledge nodes available; skipping AI mapping")
+            return self._normalize_mapping(
+                mapping={},
+                question=question,
+                choices=choices,
+                correct_answers=correct_answers,
+                answer_description=answer_description,
+            )
+
         # Use AI to generate mapping
-        mapping = self._generate_mapping(
+        mapping = await self._generate_mapping(
             question=question,
             choices=choices,
             knowledge_nodes=knowledge_nodes,
@@ -106,55 +163,54 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
         self, labels: List[str], limit: int
     ) -> List[Dict[str, Any]]:
         """
-        Fetch knowledge nodes from Neo4j.
+        Fetch knowledge nodes from Neo4j, served from a short-lived cache.
 
         Returns a list of dicts with 'id' and 'name' keys.
         """
-        nodes = []
-
-        try:
-            # Import here to avoid circular import
-            from knowledge.neo_models import Knowledge
-
-            # Query all Knowledge nodes
-            for knowledge in Knowledge.nodes.all()[:limit]:
-                node_id = knowledge.element_id
-                node_name = getattr(knowledge, "name", "")
-
-                if node_id and node_name:
-                    # Extract numeric ID from Neo4j element_id format
-                    numeric_id = self._extract_numeric_id(node_id)
-                    if numeric_id is not None:
-                        nodes.append(
-                            {"id": numeric_id, "element_id": node_id, "name": node_name}
-                        )
-        except Exception as e:
-            # Log but don't fail - return empty list
-            import logging
-
-            logging.getLogger(__name__).warning(f"Failed to fetch knowledge nodes: {e}")
-
-        return nodes
-
-    def _extract_numeric_id(self, element_id: str) -> Optional[int]:
+        key = (tuple(sorted(labels)), limit)
+        cached = _knowledge_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < KNOWLEDGE_CACHE_TTL:
+            return list(cached[1])
+
+        nodes = self._query_knowledge_nodes(labels, limit)
+        # Don't cache an empty result; it is usually a failed fetch
+        if nodes and KNOWLEDGE_CACHE_TTL > 0:
+            _knowledge_cache[key] = (time.monotonic(), nodes)
+        return list(nodes)
+
+    def _query_knowledge_nodes(
+        self, labels: List[str], limit: int
+    ) -> List[Dict[str, Any]]:
         """
-        Extract numeric ID from Neo4j element_id format.
+        Query knowledge nodes from Neo4j as plain dicts.
 
-        Format: "4:uuid:numeric_id"
+        Only the ids and name are projected, so no neomodel objects
+        are hydrated, and LIMIT is applied by the database.
         """
-        if not isinstance(element_id, str):
-            return None
+        # Labels can't be parameters; escape them and match any of them
+        label_expr = "|".join(
+            "`{}`".format(label.replace("`", "``")) for label in labels
+        )
+        # id(n) is what Neo4jQuizService matches knowledge ids against, so
+        # project it directly instead of parsing it out of elementId(n)
+        query = (
+            f"MATCH (n:{label_expr}) WHERE n.name IS NOT NULL AND n.name <> '' "
+            "RETURN id(n), elementId(n), n.name LIMIT $limit"
+        )
 
-        parts = element_id.split(":")
-        if len(parts) >= 3:
-            try:
-                return int(parts[-1])
-            except (ValueError, IndexError):
-                pass
+        try:
+            rows, _ = db.cypher_query(query, {"limit": limit})
+        except Exception as e:
+            # Log but don't fail - return empty list
+            logger.warning("Failed to fetch knowledge nodes: %s", e)
+            return []
 
-        return None
+        return [
+            {"id": node_id, "element_id": element_id, "name": node_name}
+            for node_id, element_id, node_name in rows
+        ]
 
-    def _generate_mapping(
+    async def _generate_mapping(
         self,
         question: str,
         choices: List[str],
@@ -168,11 +224,7 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
         Returns the raw mapping from the AI task.
         """
         # Prepare AI config
-        cfg = AIConfig()
-        if ai_provider:
-            cfg.provider = ai_provider
-        if ai_model:
-            cfg.model = ai_model
+        cfg = AIConfig().with_overrides(provider=ai_provider, model=ai_model)
 
         # Prepare input for AI task
         task_input = {
@@ -183,13 +235,10 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
 
         # Invoke AI task
         try:
-            result = asyncio.run(invoke("map_question_knowledge", task_input, cfg))
-            return result
+            return await invoke("map_question_knowledge", task_input, cfg)
         except Exception as e:
             # Log and return empty mapping
-            import logging
-
-            logging.getLogger(__name__).error(f"AI mapping failed: {e}")
+            logger.error("AI mapping failed: %s", e)
             return {"question_knowledge_ids": [], "choices": []}
 
     def _normalize_mapping(
@@ -205,33 +254,35 @@ class QuestionKnowledgeMappingService(BaseService[Dict[str, Any], Dict[str, Any]
 
         Ensures all choices are present with correct structure and metadata.
         """
-        correct_set = set(correct_answers or [])
+        # Compare answers case- and whitespace-insensitively
+        correct_set = {normalize_answer(c) for c in correct_answers or []}
 
         output: Dict[str, Any] = {
             "question": question,
             "answer_description": answer_description,
-            "question_knowledge_ids": [
-                int(x) for x in (mapping.get("question_knowledge_ids") or [])
-            ],
+            "question_knowledge_ids": _int_ids(mapping.get("question_knowledge_ids")),
             "choices": [],
         }
 
+        # Index AI choices once instead of scanning the list for every choice;
+        # the first entry for an index wins, as with the old linear search
+        ai_choices: Dict[Any, Dict[str, Any]] = {}
+        for c in mapping.get("choices") or []:
+            if isinstance(c, dict):
+                ai_choices.setdefault(c.get("index"), c)
+
         # Process each choice
         for i, choice_text in enumerate(choices, start=1):
-            # Find matching choice from AI mapping
-            found = next(
-                (c for c in mapping.get("choices", []) if c.get("index") == i), None
-            )
+            found = ai_choices.get(i)
 
             output["choices"].append(
                 {
                     "index": i,
                     "text": choice_text,
-                    "knowledge_ids": [
-                        int(x)
-                        for x in (found.get("knowledge_ids", []) if found else [])
-                    ],
-                    "is_correct": choice_text in correct_set,
+                    "knowledge_ids": _int_ids(
+                        found.get("knowledge_ids") if found else None
+                    ),
+                    "is_correct": normalize_answer(choice_text) in correct_set,
                 }
             )
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class StudentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'student'
+
+    def ready(self):
+        # Load the neomodel classes so `manage.py install_labels` finds them
+        # and installs the Student.username and Student.db_id indexes
+        from . import neo_models  # noqa: F401
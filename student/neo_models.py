@@ -43,8 +43,8 @@ class Student(StructuredNode):
     A student user who takes quizzes and learns knowledge topics.
     """
 
-    username = StringProperty(required=True)
-    db_id = StringProperty(required=True)
+    username = StringProperty(required=True, index=True)
+    db_id = StringProperty(required=True, index=True)
 
     # Relationship to Knowledge with properties tracking learning progress
     related_to = RelationshipTo(
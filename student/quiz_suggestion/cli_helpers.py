@@ -5,6 +5,7 @@ This module provides utilities for interactive quiz sessions, progress display,
 and user input handling.
 """
 
+from collections import Counter
 from typing import List
 from student.quiz_suggestion import (
     suggest_next_quiz,
@@ -58,6 +59,19 @@ class QuizSession:
         return get_learning_progress(self.profile, self.kg)
 
 
+def _write_lines(stdout, lines: List[str]):
+    """
+    Write buffered lines to stdout in a single call.
+
+    Each line is terminated the same way OutputWrapper.write would
+    terminate it, so output matches one write() per line.
+    """
+    stdout.write(
+        "".join(line if line.endswith("\n") else line + "\n" for line in lines),
+        ending="",
+    )
+
+
 def display_quiz(quiz: Quiz, stdout, style):
     """
     Display a quiz question.
@@ -67,18 +81,20 @@ def display_quiz(quiz: Quiz, stdout, style):
         stdout: Output stream
         style: Django style helper
     """
-    stdout.write(f"\n{quiz.content.stem}\n")
+    lines = [f"\n{quiz.content.stem}\n"]
 
     if quiz.content.choices:
         for i, choice in enumerate(quiz.content.choices, 1):
-            stdout.write(f"  {i}. {choice}")
+            lines.append(f"  {i}. {choice}")
 
-    stdout.write(f"\nDifficulty: {quiz.difficulty_level}/5")
-    stdout.write(f"Type: {quiz.quiz_type}")
-    stdout.write(
+    lines.append(f"\nDifficulty: {quiz.difficulty_level}/5")
+    lines.append(f"Type: {quiz.quiz_type}")
+    lines.append(
         f"Covers: {', '.join(quiz.linked_nodes[:3])}{'...' if len(quiz.linked_nodes) > 3 else ''}\n"
     )
 
+    _write_lines(stdout, lines)
+
 
 def get_user_answer(quiz: Quiz, stdout, style) -> bool:
     """
@@ -124,37 +140,38 @@ def display_progress(profile: UserProfile, kg: KnowledgeGraph, stdout, style):
     """
     progress = get_learning_progress(profile, kg)
 
-    stdout.write(style.SUCCESS("\n📊 Learning Progress\n"))
-    stdout.write("─" * 60)
+    lines = [style.SUCCESS("\n📊 Learning Progress\n"), "─" * 60]
 
-    stdout.write(f"\nMastered nodes: {len(progress['mastered_nodes'])}")
-    stdout.write(f"In progress: {len(progress['in_progress_nodes'])}")
-    stdout.write(f"Weak nodes: {len(progress['weak_nodes'])}")
-    stdout.write(f"Coverage: {progress['coverage_pct']:.1f}%")
+    lines.append(f"\nMastered nodes: {len(progress['mastered_nodes'])}")
+    lines.append(f"In progress: {len(progress['in_progress_nodes'])}")
+    lines.append(f"Weak nodes: {len(progress['weak_nodes'])}")
+    lines.append(f"Coverage: {progress['coverage_pct']:.1f}%")
 
-    stdout.write(f"\nTotal attempts: {progress['total_attempts']}")
-    stdout.write(f"Correct: {progress['total_correct']}")
-    stdout.write(f"Accuracy: {progress['accuracy']:.1%}")
+    lines.append(f"\nTotal attempts: {progress['total_attempts']}")
+    lines.append(f"Correct: {progress['total_correct']}")
+    lines.append(f"Accuracy: {progress['accuracy']:.1%}")
 
-    stdout.write(f"\nDue for review: {progress['next_due_reviews']} nodes")
+    lines.append(f"\nDue for review: {progress['next_due_reviews']} nodes")
 
     # Show top weak nodes
     if progress["weak_nodes"]:
-        stdout.write(f"\n\nWeakest nodes (top 5):")
+        lines.append(f"\n\nWeakest nodes (top 5):")
         for i, node_id in enumerate(progress["weak_nodes"][:5], 1):
             score = profile.get_score(node_id)
-            stdout.write(f"  {i}. {node_id}: {score:.2f}")
+            lines.append(f"  {i}. {node_id}: {score:.2f}")
 
     # Show recently mastered
     if progress["mastered_nodes"]:
-        stdout.write(
+        lines.append(
             f"\n\nMastered nodes (showing {min(5, len(progress['mastered_nodes']))}):"
         )
         for i, node_id in enumerate(progress["mastered_nodes"][:5], 1):
             score = profile.get_score(node_id)
-            stdout.write(f"  {i}. {node_id}: {score:.2f}")
+            lines.append(f"  {i}. {node_id}: {score:.2f}")
 
-    stdout.write("\n" + "─" * 60 + "\n")
+    lines.append("\n" + "─" * 60 + "\n")
+
+    _write_lines(stdout, lines)
 
 
 def display_graph_stats(kg: KnowledgeGraph, quizzes: List[Quiz], stdout, style):
@@ -167,42 +184,39 @@ def display_graph_stats(kg: KnowledgeGraph, quizzes: List[Quiz], stdout, style):
         stdout: Output stream
         style: Django style helper
     """
-    stdout.write(style.SUCCESS("\n📈 Knowledge Graph Statistics\n"))
-    stdout.write("─" * 60)
+    lines = [style.SUCCESS("\n📈 Knowledge Graph Statistics\n"), "─" * 60]
 
-    stdout.write(f"\nTotal knowledge nodes: {len(kg.nodes())}")
-    stdout.write(f"Total prerequisite edges: {len(kg.edges())}")
-    stdout.write(f"Total quizzes: {len(quizzes)}")
+    lines.append(f"\nTotal knowledge nodes: {len(kg.nodes())}")
+    lines.append(f"Total prerequisite edges: {len(kg.edges())}")
+    lines.append(f"Total quizzes: {len(quizzes)}")
 
     # Check for cycles
     if kg.is_acyclic():
-        stdout.write(style.SUCCESS("\n✓ Graph is acyclic (no circular dependencies)"))
+        lines.append(style.SUCCESS("\n✓ Graph is acyclic (no circular dependencies)"))
     else:
         cycles = kg.find_cycles()
-        stdout.write(style.ERROR(f"\n✗ Graph has {len(cycles)} cycle(s)!"))
+        lines.append(style.ERROR(f"\n✗ Graph has {len(cycles)} cycle(s)!"))
         for i, cycle in enumerate(cycles[:3], 1):
-            stdout.write(f"  Cycle {i}: {' → '.join(cycle)}")
+            lines.append(f"  Cycle {i}: {' → '.join(cycle)}")
 
     # Topological order sample
     try:
         topo = kg.topological_order()
-        stdout.write(f"\n\nTopological order (first 10):")
+        lines.append(f"\n\nTopological order (first 10):")
         for i, node_id in enumerate(topo[:10], 1):
-            stdout.write(f"  {i}. {node_id}")
+            lines.append(f"  {i}. {node_id}")
     except Exception as e:
-        stdout.write(style.ERROR(f"\nFailed to compute topological order: {e}"))
+        lines.append(style.ERROR(f"\nFailed to compute topological order: {e}"))
 
     # Quiz difficulty distribution
-    difficulty_counts = {}
-    for quiz in quizzes:
-        difficulty_counts[quiz.difficulty_level] = (
-            difficulty_counts.get(quiz.difficulty_level, 0) + 1
-        )
+    difficulty_counts = Counter(quiz.difficulty_level for quiz in quizzes)
 
-    stdout.write(f"\n\nQuiz difficulty distribution:")
+    lines.append(f"\n\nQuiz difficulty distribution:")
     for difficulty in sorted(difficulty_counts.keys()):
         count = difficulty_counts[difficulty]
         pct = count / len(quizzes) * 100
-        stdout.write(f"  Level {difficulty}: {count} ({pct:.1f}%)")
+        lines.append(f"  Level {difficulty}: {count} ({pct:.1f}%)")
+
+    lines.append("\n" + "─" * 60 + "\n")
 
-    stdout.write("\n" + "─" * 60 + "\n")
+    _write_lines(stdout, lines)
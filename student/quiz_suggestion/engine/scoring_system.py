@@ -74,7 +74,7 @@ class ScoringSystem:
         Returns:
             Updated user profile
         """
-        logger.info(f"Applying correct answer for quiz {quiz_id}, nodes: {node_ids}")
+        logger.debug("Applying correct answer for quiz %s, nodes: %s", quiz_id, node_ids)
         
         # Update scores for linked nodes
         for node_id in node_ids:
@@ -125,7 +125,7 @@ class ScoringSystem:
         Returns:
             Updated user profile
         """
-        logger.info(f"Applying incorrect answer for quiz {quiz_id}, nodes: {node_ids}")
+        logger.debug("Applying incorrect answer for quiz %s, nodes: %s", quiz_id, node_ids)
         
         # Update scores for linked nodes
         for node_id in node_ids:
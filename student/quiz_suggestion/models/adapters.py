@@ -9,6 +9,9 @@ validated data structures.
 from typing import List, Optional
 from pydantic import BaseModel, Field, field_validator
 from student.quiz_suggestion.exceptions import InvalidDifficultyError
+from student.quiz_suggestion.engine.policies import MIN_DIFFICULTY, MAX_DIFFICULTY
+
+VALID_QUIZ_TYPES = ("multiple_choice", "fill_in_blank")
 
 
 class QuizContent(BaseModel):
@@ -38,11 +41,6 @@ class Quiz(BaseModel):
     @classmethod
     def validate_difficulty(cls, v):
         """Ensure difficulty is in valid range [1, 5]"""
-        from student.quiz_suggestion.engine.policies import (
-            MIN_DIFFICULTY,
-            MAX_DIFFICULTY,
-        )
-
         if not (MIN_DIFFICULTY <= v <= MAX_DIFFICULTY):
             raise InvalidDifficultyError(
                 f"Difficulty {v} must be in range [{MIN_DIFFICULTY}, {MAX_DIFFICULTY}]"
@@ -53,9 +51,10 @@ class Quiz(BaseModel):
     @classmethod
     def validate_quiz_type(cls, v):
         """Ensure quiz type is valid"""
-        valid_types = ["multiple_choice", "fill_in_blank"]
-        if v not in valid_types:
-            raise ValueError(f"Quiz type must be one of {valid_types}, got {v!r}")
+        if v not in VALID_QUIZ_TYPES:
+            raise ValueError(
+                f"Quiz type must be one of {list(VALID_QUIZ_TYPES)}, got {v!r}"
+            )
         return v
 
     @classmethod
@@ -87,27 +86,47 @@ class Quiz(BaseModel):
             # If relationship doesn't exist or fails, continue with empty list
             pass
 
-        # Get choices and find correct answer
+        # Get choices
         choices = []
-        answer = ""
-        explanation = ""
-
         try:
-            for choice in neo_quiz.has_choice.all():
-                choice_text = choice.choice_text
-                choices.append(choice_text)
-
-                if choice.is_correct:
-                    answer = choice_text
-                    if (
-                        hasattr(choice, "answer_explanation")
-                        and choice.answer_explanation
-                    ):
-                        explanation = choice.answer_explanation
+            choices = [
+                {
+                    "choice_text": choice.choice_text,
+                    "is_correct": choice.is_correct,
+                    "answer_explanation": getattr(choice, "answer_explanation", None),
+                }
+                for choice in neo_quiz.has_choice.all()
+            ]
         except Exception:
             # If relationship doesn't exist or fails, continue with empty choices
             pass
 
+        return cls.from_neo4j_parts(neo_quiz, linked_nodes, choices)
+
+    @classmethod
+    def from_neo4j_parts(
+        cls, neo_quiz, linked_nodes: List[str], choices: List[dict]
+    ) -> "Quiz":
+        """
+        Build a Pydantic Quiz from a Neo4j Quiz node and its pre-fetched links.
+
+        Args:
+            neo_quiz: A quiz.neo_models.Quiz instance
+            linked_nodes: Element IDs of the Knowledge nodes the quiz covers
+            choices: Choice property dicts (choice_text, is_correct, answer_explanation)
+
+        Returns:
+            Quiz: Pydantic Quiz model
+        """
+        # Find correct answer
+        answer = ""
+        explanation = ""
+        for choice in choices:
+            if choice.get("is_correct"):
+                answer = choice["choice_text"]
+                if choice.get("answer_explanation"):
+                    explanation = choice["answer_explanation"]
+
         # Get quiz properties with defaults
         difficulty = getattr(neo_quiz, "difficulty_level", 3) or 3
         quiz_type = (
@@ -123,7 +142,7 @@ class Quiz(BaseModel):
             quiz_type=quiz_type,
             content=QuizContent(
                 stem=neo_quiz.quiz_text,
-                choices=choices,
+                choices=[choice["choice_text"] for choice in choices],
                 answer=answer,
                 explanation=explanation,
             ),
@@ -178,12 +197,25 @@ def load_quizzes_from_neo4j() -> List[Quiz]:
         quizzes = load_quizzes_from_neo4j()
         print(f"Loaded {len(quizzes)} quizzes")
     """
+    from neomodel import db
     from quiz.neo_models import Quiz as NeoQuiz
 
+    # One query for every quiz with its knowledge links and choices,
+    # instead of two relationship traversals per quiz
+    query = """
+    MATCH (q:Quiz)
+    RETURN q,
+        [(q)-[:RELATED_TO]->(k:Knowledge) | elementId(k)] AS linked_nodes,
+        [(q)-[:HAS_CHOICE]->(c:Choice) |
+            c {.choice_text, .is_correct, .answer_explanation}] AS choices
+    """
+    results, _ = db.cypher_query(query)
+
     quizzes = []
-    for neo_quiz in NeoQuiz.nodes.all():
+    for node, linked_nodes, choices in results:
+        neo_quiz = NeoQuiz.inflate(node)
         try:
-            quiz = Quiz.from_neo4j(neo_quiz)
+            quiz = Quiz.from_neo4j_parts(neo_quiz, linked_nodes, choices)
             quizzes.append(quiz)
         except Exception as e:
             # Log warning but continue
@@ -207,53 +207,35 @@ class KnowledgeGraph:
             kg = KnowledgeGraph.from_neo4j()
             print(f"Loaded {len(kg.nodes())} knowledge nodes")
         """
-        from knowledge.neo_models import Knowledge as NeoKnowledge
+        from neomodel import db
 
         kg = cls()
 
-        # Load all knowledge nodes
+        # Load all knowledge nodes in one query
         logger.info("Loading knowledge nodes from Neo4j...")
-        for neo_knowledge in NeoKnowledge.nodes.all():
-            try:
-                # Get unique ID (use element_id for Neo4j v5+, fallback to name)
-                node_id = (
-                    getattr(neo_knowledge, "element_id", None) or neo_knowledge.name
-                )
-
-                # Add node with attributes
-                kg.add_node(
-                    str(node_id),
-                    name=neo_knowledge.name,
-                    description=getattr(neo_knowledge, "description", None),
-                    example=getattr(neo_knowledge, "example", None),
-                )
-            except Exception as e:
-                logger.warning(f"Failed to load knowledge node {neo_knowledge}: {e}")
-                continue
+        node_query = """
+        MATCH (k:Knowledge)
+        RETURN elementId(k), k.name, k.description, k.example
+        """
+        nodes, _ = db.cypher_query(node_query)
+        for node_id, name, description, example in nodes:
+            kg.add_node(node_id, name=name, description=description, example=example)
 
         logger.info(f"Loaded {len(kg.nodes())} knowledge nodes")
 
-        # Load all DEPENDS_ON relationships
+        # Load all DEPENDS_ON relationships in one query, instead of a
+        # depends_on traversal per node
         logger.info("Loading prerequisite relationships...")
+        edge_query = """
+        MATCH (k:Knowledge)-[:DEPENDS_ON]->(prereq:Knowledge)
+        RETURN elementId(k), elementId(prereq)
+        """
+        edges, _ = db.cypher_query(edge_query)
         edge_count = 0
-        for neo_knowledge in NeoKnowledge.nodes.all():
-            try:
-                from_id = (
-                    getattr(neo_knowledge, "element_id", None) or neo_knowledge.name
-                )
-                from_id = str(from_id)
-
-                # Get prerequisites (nodes this one depends on)
-                for prereq in neo_knowledge.depends_on.all():
-                    to_id = getattr(prereq, "element_id", None) or prereq.name
-                    to_id = str(to_id)
-
-                    if kg.has_node(from_id) and kg.has_node(to_id):
-                        kg.add_edge(from_id, to_id)
-                        edge_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to load prerequisites for {neo_knowledge}: {e}")
-                continue
+        for from_id, to_id in edges:
+            if kg.has_node(from_id) and kg.has_node(to_id):
+                kg.add_edge(from_id, to_id)
+                edge_count += 1
 
         logger.info(f"Loaded {edge_count} prerequisite relationships")
 
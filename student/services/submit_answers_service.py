@@ -1,13 +1,15 @@
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List
 from datetime import datetime, timezone
 
+from neomodel import db
+
 from core.api import APIError
 from core.services import BaseService, ServiceContext
 from student.neo_models import Student as NeoStudent
 from quiz.neo_models import Quiz as NeoQuiz, Choice as NeoChoice
-from knowledge.neo_models import Knowledge as NeoKnowledge
 from student.quiz_suggestion import (
     update_scores,
     load_quizzes_from_neo4j,
@@ -18,6 +20,9 @@ from student.quiz_suggestion.models.adapters import Quiz as PydanticQuiz
 
 logger = logging.getLogger(__name__)
 
+# Shared, never-mutated default for knowledge nodes missing from the graph
+_NO_NODE_DATA: Dict[str, Any] = {}
+
 
 class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
     """
@@ -70,7 +75,7 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
             )
 
         # Track all knowledge adjustments
-        all_adjustments: Dict[str, float] = {}
+        all_adjustments: Dict[str, float] = defaultdict(float)
 
         # Process each answer
         for idx, answer_data in enumerate(answers):
@@ -79,7 +84,7 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
 
                 # Accumulate adjustments
                 for node_id, delta in adjustments.items():
-                    all_adjustments[node_id] = all_adjustments.get(node_id, 0.0) + delta
+                    all_adjustments[node_id] += delta
 
             except Exception as e:
                 logger.error(f"Failed to process answer {idx}: {e}")
@@ -199,9 +204,11 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
             if delta != 0:
                 adjustments[node_id] = delta
 
-        logger.info(
-            f"Processed answer for quiz {quiz_gid}: "
-            f"correct={is_correct}, adjustments={len(adjustments)}"
+        logger.debug(
+            "Processed answer for quiz %s: correct=%s, adjustments=%d",
+            quiz_gid,
+            is_correct,
+            len(adjustments),
         )
 
         return adjustments
@@ -209,10 +216,12 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
     def _get_neo_quiz_by_id(self, quiz_id: str) -> NeoQuiz | None:
         """Get a Neo4j Quiz node by its element_id."""
         try:
-            for quiz in NeoQuiz.nodes.all():
-                if getattr(quiz, "element_id", None) == quiz_id:
-                    return quiz
-            return None
+            # Look up the one quiz directly instead of inflating every Quiz node
+            results, _ = db.cypher_query(
+                "MATCH (q:Quiz) WHERE elementId(q) = $quiz_id RETURN q",
+                {"quiz_id": quiz_id},
+            )
+            return NeoQuiz.inflate(results[0][0]) if results else None
         except Exception as e:
             logger.error(f"Failed to fetch Neo4j quiz {quiz_id}: {e}")
             return None
@@ -246,20 +255,16 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
         Returns:
             List of graph update objects
         """
-        graph_updates = []
-
-        for node_id, adjustment in adjustments.items():
-            # Get knowledge node name from the graph
-            node_data = kg.graph.nodes.get(node_id, {})
-            knowledge_name = node_data.get("name", "Unknown")
-
-            graph_updates.append(
-                {
-                    "graph_id": node_id,
-                    "knowledge": knowledge_name,
-                    "adjustment": round(adjustment, 2),
-                }
-            )
+        # Knowledge node names come from the graph; bind the lookup once
+        node_data = kg.graph.nodes.get
+        graph_updates = [
+            {
+                "graph_id": node_id,
+                "knowledge": node_data(node_id, _NO_NODE_DATA).get("name", "Unknown"),
+                "adjustment": round(adjustment, 2),
+            }
+            for node_id, adjustment in adjustments.items()
+        ]
 
         # Sort by absolute adjustment (largest changes first)
         graph_updates.sort(key=lambda x: abs(x["adjustment"]), reverse=True)
@@ -277,7 +282,8 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
         Update Student-Knowledge relationships in Neo4j based on quiz results.
 
         This method creates or updates relationships between the student and
-        knowledge nodes, storing metadata about their learning progress.
+        knowledge nodes, storing metadata about their learning progress. All
+        links are written with a single UNWIND ... MERGE query.
 
         Args:
             student_node: Neo4j Student node
@@ -289,75 +295,61 @@ class SubmitAnswersService(BaseService[Dict[str, Any], Dict[str, Any]]):
             logger.info("No adjustments to update in graph")
             return
 
-        updated_count = 0
-        created_count = 0
-
-        # Build knowledge nodes map for quick lookup
-        knowledge_nodes_map = {}
-        for k_node in NeoKnowledge.nodes.all():
-            element_id = getattr(k_node, "element_id", None)
-            if element_id:
-                knowledge_nodes_map[element_id] = k_node
-
         logger.info(
             f"Updating Student-Knowledge links for {len(adjustments)} knowledge nodes"
         )
 
-        for node_element_id, adjustment in adjustments.items():
-            try:
-                # Get knowledge node
-                knowledge_node = knowledge_nodes_map.get(node_element_id)
-                if not knowledge_node:
-                    logger.warning(
-                        f"Knowledge node {node_element_id} not found in Neo4j"
-                    )
-                    continue
-
-                # Get current score from profile
-                current_score = profile.get_score(node_element_id)
-
-                # Check if relationship already exists
-                if student_node.related_to.is_connected(knowledge_node):
-                    # Update existing relationship
-                    rel = student_node.related_to.relationship(knowledge_node)
-                    rel.last_score = current_score + adjustment
-                    rel.last_updated = datetime.now(timezone.utc)
-                    rel.total_attempts = getattr(rel, "total_attempts", 0) + 1
-
-                    # Increment total_correct if adjustment is positive (correct answer)
-                    if adjustment > 0:
-                        rel.total_correct = getattr(rel, "total_correct", 0) + 1
-
-                    rel.save()
-                    updated_count += 1
-
-                    logger.debug(
-                        f"Updated relationship: Student -> {knowledge_node.name}, "
-                        f"score: {current_score}, attempts: {rel.total_attempts}"
-                    )
-                else:
-                    # Create new relationship
-                    rel_props = {
-                        "last_score": current_score,
-                        "last_updated": datetime.now(timezone.utc),
-                        "total_attempts": 1,
-                        "total_correct": adjustment,
-                    }
-
-                    student_node.related_to.connect(knowledge_node, rel_props)
-                    created_count += 1
-
-                    logger.debug(
-                        f"Created relationship: Student -> {knowledge_node.name}, "
-                        f"score: {current_score}"
-                    )
+        rows = [
+            {
+                "element_id": node_element_id,
+                "score": profile.get_score(node_element_id),
+                "adjustment": adjustment,
+            }
+            for node_element_id, adjustment in adjustments.items()
+        ]
+
+        # last_updated is stored the way neomodel's DateTimeProperty stores it
+        # (float seconds since the epoch); one timestamp per submission.
+        query = """
+        MATCH (s:Student) WHERE elementId(s) = $student_id
+        UNWIND $rows AS row
+        MATCH (k:Knowledge) WHERE elementId(k) = row.element_id
+        WITH s, k, row, NOT EXISTS { (s)-[:RELATED_TO]->(k) } AS created
+        MERGE (s)-[r:RELATED_TO]->(k)
+        ON CREATE SET
+            r.last_score = row.score,
+            r.total_attempts = 1,
+            r.total_correct = toInteger(row.adjustment)
+        ON MATCH SET
+            r.last_score = row.score + row.adjustment,
+            r.total_attempts = coalesce(r.total_attempts, 0) + 1,
+            r.total_correct = coalesce(r.total_correct, 0)
+                + CASE WHEN row.adjustment > 0 THEN 1 ELSE 0 END
+        SET r.last_updated = $now
+        RETURN row.element_id, created
+        """
+        params = {
+            "student_id": student_node.element_id,
+            "rows": rows,
+            "now": datetime.now(timezone.utc).timestamp(),
+        }
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to update Student-Knowledge link for {node_element_id}: {e}",
-                    exc_info=True,
-                )
-                continue
+        try:
+            results, _ = db.cypher_query(query, params)
+        except Exception as e:
+            logger.error(
+                f"Failed to update Student-Knowledge links: {e}",
+                exc_info=True,
+            )
+            return
+
+        written = {element_id: created for element_id, created in results}
+        for node_element_id in adjustments:
+            if node_element_id not in written:
+                logger.warning(f"Knowledge node {node_element_id} not found in Neo4j")
+
+        created_count = sum(1 for created in written.values() if created)
+        updated_count = len(written) - created_count
 
         logger.info(
             f"Student-Knowledge links updated: {created_count} created, "
@@ -1,5 +1,4 @@
 import logging
-import random
 from typing import Any, Dict, List, Optional, Set
 
 from neomodel import db
@@ -64,6 +63,7 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
         has_knowledge = self._has_knowledge_relationships(student_node)
 
         suggested_quiz_nodes = []
+        suggested_quiz_ids = set()
 
         if has_knowledge:
             # Existing user: suggest based on weakness knowledge
@@ -81,24 +81,19 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
                 if len(suggested_quiz_nodes) >= quiz_limit:
                     break
 
-                # Get quizzes related to this knowledge node
-                related_quizzes = self._get_quizzes_for_knowledge(knowledge_node)
+                # Get unseen quizzes related to this knowledge node
+                related_quizzes = self._get_quizzes_for_knowledge(
+                    knowledge_node,
+                    exclude_ids=recent_quiz_ids | suggested_quiz_ids,
+                    limit=quiz_limit - len(suggested_quiz_nodes),
+                )
 
-                # Filter out quizzes from recent history
                 for quiz_node in related_quizzes:
-                    if len(suggested_quiz_nodes) >= quiz_limit:
-                        break
-
-                    quiz_id = getattr(quiz_node, "element_id", None)
-                    if quiz_id and quiz_id not in recent_quiz_ids:
-                        # Avoid duplicates in current suggestion
-                        if quiz_id not in [
-                            getattr(q, "element_id", None) for q in suggested_quiz_nodes
-                        ]:
-                            suggested_quiz_nodes.append(quiz_node)
-                            logger.debug(
-                                f"Added quiz {quiz_id} from knowledge {knowledge_node.name}"
-                            )
+                    suggested_quiz_ids.add(quiz_node.element_id)
+                    suggested_quiz_nodes.append(quiz_node)
+                    logger.debug(
+                        f"Added quiz {quiz_node.element_id} from knowledge {knowledge_node.name}"
+                    )
 
             logger.info(
                 f"Collected {len(suggested_quiz_nodes)} quizzes from {len(weakness_knowledge_nodes)} weakness knowledge nodes"
@@ -159,8 +154,17 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
             True if student has at least one RELATED_TO relationship
         """
         try:
-            # Check if there's at least one relationship
-            return student_node.related_to.all()[:1].count() > 0
+            # Probe for a single relationship instead of loading all of them
+            query = """
+            MATCH (s:Student)-[:RELATED_TO]->(:Knowledge)
+            WHERE elementId(s) = $student_id
+            RETURN 1
+            LIMIT 1
+            """
+            results, _ = db.cypher_query(
+                query, {"student_id": student_node.element_id}
+            )
+            return bool(results)
         except Exception as e:
             logger.error(f"Failed to check knowledge relationships: {e}")
             return False
@@ -216,19 +220,36 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
             logger.error(f"Failed to get weakness knowledge nodes: {e}", exc_info=True)
             return []
 
-    def _get_quizzes_for_knowledge(self, knowledge_node: NeoKnowledge) -> List[NeoQuiz]:
+    def _get_quizzes_for_knowledge(
+        self, knowledge_node: NeoKnowledge, exclude_ids: Set[str], limit: int
+    ) -> List[NeoQuiz]:
         """
-        Get all quizzes related to a knowledge node.
+        Get quizzes related to a knowledge node, skipping excluded quizzes.
 
         Args:
             knowledge_node: Neo4j Knowledge node
+            exclude_ids: Quiz element IDs to skip (recent history, already suggested)
+            limit: Maximum number of quizzes to return
 
         Returns:
-            List of Quiz nodes related to this knowledge
+            List of at most `limit` Quiz nodes related to this knowledge
         """
         try:
-            # Get quizzes that have RELATED_TO relationship with this knowledge
-            quizzes = list(knowledge_node.related_quizzes.all())
+            # Filter and cap on the server so only needed quizzes are hydrated
+            query = """
+            MATCH (q:Quiz)-[:RELATED_TO]->(k:Knowledge)
+            WHERE elementId(k) = $knowledge_id
+              AND NOT elementId(q) IN $exclude_ids
+            RETURN q
+            LIMIT $limit
+            """
+            params = {
+                "knowledge_id": knowledge_node.element_id,
+                "exclude_ids": list(exclude_ids),
+                "limit": limit,
+            }
+            results, _ = db.cypher_query(query, params)
+            quizzes = [NeoQuiz.inflate(row[0]) for row in results]
             logger.debug(
                 f"Found {len(quizzes)} quizzes for knowledge '{knowledge_node.name}'"
             )
@@ -292,43 +313,40 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
             List of random Quiz nodes
         """
         try:
+            # Exclusion and sampling run server-side so only `limit` quizzes
+            # are returned and hydrated instead of the whole Quiz label.
             if scope_topic:
                 # Get quizzes related to knowledge nodes matching the topic
                 query = """
                 MATCH (q:Quiz)-[:RELATED_TO]->(k:Knowledge)
                 WHERE toLower(k.name) CONTAINS toLower($topic)
-                RETURN DISTINCT q
+                WITH DISTINCT q
                 """
-                params = {"topic": scope_topic}
-                results, _ = db.cypher_query(query, params)
-
-                all_quizzes = []
-                for row in results:
-                    quiz_node = NeoQuiz.inflate(row[0])
-                    quiz_id = getattr(quiz_node, "element_id", None)
-                    if quiz_id and quiz_id not in exclude_quiz_ids:
-                        all_quizzes.append(quiz_node)
-
-                logger.info(
-                    f"Found {len(all_quizzes)} quizzes for topic '{scope_topic}' (excluding recent)"
-                )
             else:
-                # Get all quizzes
-                all_quizzes = []
-                for quiz in NeoQuiz.nodes.all():
-                    quiz_id = getattr(quiz, "element_id", None)
-                    if quiz_id and quiz_id not in exclude_quiz_ids:
-                        all_quizzes.append(quiz)
-
-                logger.info(
-                    f"Found {len(all_quizzes)} total quizzes (excluding recent)"
-                )
+                query = """
+                MATCH (q:Quiz)
+                """
 
-            # Randomly select up to limit quizzes
-            if len(all_quizzes) <= limit:
-                return all_quizzes
-            else:
-                return random.sample(all_quizzes, limit)
+            query += """
+            WHERE NOT elementId(q) IN $exclude_ids
+            RETURN q
+            ORDER BY rand()
+            LIMIT $limit
+            """
+            params = {
+                "topic": scope_topic,
+                "exclude_ids": list(exclude_quiz_ids),
+                "limit": limit,
+            }
+
+            results, _ = db.cypher_query(query, params)
+            quizzes = [NeoQuiz.inflate(row[0]) for row in results]
+
+            logger.info(
+                f"Selected {len(quizzes)} random quizzes (excluding recent)"
+                + (f" for topic '{scope_topic}'" if scope_topic else "")
+            )
+            return quizzes
 
         except Exception as e:
             logger.error(f"Failed to get random quizzes: {e}", exc_info=True)
@@ -340,78 +358,79 @@ class SuggestQuizService(BaseService[Dict[str, Any], Dict[str, Any]]):
         """
         Convert Neo4j Quiz nodes to API response format.
 
+        Choices and related knowledge for all quizzes are fetched as map
+        projections in a single query rather than walking each quiz's
+        relationships through the OGM.
+
         Args:
             neo_quizzes: List of Neo4j Quiz nodes
 
         Returns:
             List of quiz dictionaries in API response format
         """
+        quiz_ids = [
+            quiz_id
+            for quiz_id in (getattr(q, "element_id", None) for q in neo_quizzes)
+            if quiz_id
+        ]
+        if len(quiz_ids) < len(neo_quizzes):
+            logger.warning(
+                f"Skipping {len(neo_quizzes) - len(quiz_ids)} quizzes without element_id"
+            )
+        if not quiz_ids:
+            return []
+
+        query = """
+        MATCH (q:Quiz)
+        WHERE elementId(q) IN $quiz_ids
+        RETURN elementId(q) AS graph_id,
+               q.quiz_text AS quiz_text,
+               [(q)-[:HAS_CHOICE]->(c:Choice) | {
+                   graph_id: elementId(c),
+                   choice_text: c.choice_text,
+                   is_correct: c.is_correct,
+                   answer_explanation: c.answer_explanation,
+                   related_to: [(c)-[:RELATED_TO]->(ck:Knowledge) | {
+                       graph_id: elementId(ck), knowledge: ck.name
+                   }]
+               }] AS choices,
+               [(q)-[:RELATED_TO]->(k:Knowledge) | {
+                   graph_id: elementId(k), knowledge: k.name
+               }] AS related_to
+        """
+
+        try:
+            results, _ = db.cypher_query(query, {"quiz_ids": quiz_ids})
+        except Exception as e:
+            logger.error(f"Failed to load quiz details: {e}", exc_info=True)
+            return []
+
+        rows_by_id = {row[0]: row for row in results}
+
         quizzes_out = []
+        for quiz_id in quiz_ids:
+            row = rows_by_id.get(quiz_id)
+            if row is None:
+                logger.warning(f"Quiz {quiz_id} not found, skipping")
+                continue
 
-        for neo_quiz in neo_quizzes:
-            try:
-                quiz_id = getattr(neo_quiz, "element_id", None)
-                if not quiz_id:
-                    logger.warning("Quiz has no element_id, skipping")
-                    continue
-
-                # Build choices data
-                choices_data = []
-                try:
-                    for choice in neo_quiz.has_choice.all():
-                        # Get related knowledge for this choice
-                        rel_k = [
-                            {
-                                "graph_id": getattr(k, "element_id", str(k)),
-                                "knowledge": getattr(k, "name", ""),
-                            }
-                            for k in choice.related_to.all()
-                        ]
-
-                        choices_data.append(
-                            {
-                                "graph_id": getattr(choice, "element_id", str(choice)),
-                                "choice_text": getattr(choice, "choice_text", ""),
-                                "is_correct": bool(
-                                    getattr(choice, "is_correct", False)
-                                ),
-                                "answer_explanation": getattr(
-                                    choice, "answer_explanation", ""
-                                )
-                                or "",
-                                "related_to": rel_k,
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to load choices for quiz {quiz_id}: {e}")
-                    choices_data = []
-
-                # Get quiz-level related knowledge
-                try:
-                    rel_k_q = [
+            _, quiz_text, choices, related_to = row
+            quizzes_out.append(
+                {
+                    "graph_id": quiz_id,
+                    "quiz_text": quiz_text or "",
+                    "choices": [
                         {
-                            "graph_id": getattr(k, "element_id", str(k)),
-                            "knowledge": getattr(k, "name", ""),
+                            "graph_id": choice["graph_id"],
+                            "choice_text": choice["choice_text"] or "",
+                            "is_correct": bool(choice["is_correct"]),
+                            "answer_explanation": choice["answer_explanation"] or "",
+                            "related_to": choice["related_to"],
                         }
-                        for k in neo_quiz.related_to.all()
-                    ]
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load related knowledge for quiz {quiz_id}: {e}"
-                    )
-                    rel_k_q = []
-
-                quizzes_out.append(
-                    {
-                        "graph_id": quiz_id,
-                        "quiz_text": getattr(neo_quiz, "quiz_text", ""),
-                        "choices": choices_data,
-                        "related_to": rel_k_q,
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to convert quiz: {e}")
-                continue
+                        for choice in choices
+                    ],
+                    "related_to": related_to,
+                }
+            )
 
         return quizzes_out
@@ -0,0 +1,137 @@
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from ai_module import cache, jsonlib
+from ai_module.config import AIConfig
+from ai_module.kernel import invoke_task
+from ai_module.schemas import Message
+
+
+class EchoProvider:
+    def __init__(self):
+        self.calls = 0
+
+    async def chat(self, messages, cfg):
+        self.calls += 1
+        return '{"answer": 42}'
+
+
+class EchoTask:
+    name = "echo"
+
+    def build_messages(self, inp):
+        return [Message(role="user", content=inp["q"])]
+
+    def parse_output(self, raw_json):
+        return raw_json
+
+
+class CacheKeyTests(unittest.TestCase):
+    messages = [Message(role="user", content="hi")]
+
+    def test_generation_settings_change_the_key(self):
+        base = AIConfig()
+        key = cache.cache_key("t", self.messages, base)
+        for override in (
+            {"model": "other-model"},
+            {"temperature": base.temperature + 0.5},
+            {"max_tokens": base.max_tokens + 1},
+            {"json_only": not base.json_only},
+        ):
+            with self.subTest(override=override):
+                cfg = base.with_overrides(**override)
+                self.assertNotEqual(cache.cache_key("t", self.messages, cfg), key)
+
+    def test_throughput_settings_keep_the_key(self):
+        base = AIConfig()
+        cfg = base.with_overrides(rps=base.rps + 1, max_retries=base.max_retries + 1)
+        self.assertEqual(
+            cache.cache_key("t", self.messages, cfg),
+            cache.cache_key("t", self.messages, base),
+        )
+
+
+class StoreTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+
+    def test_round_trip(self):
+        cache.store(str(self.dir), "k", {"a": "ü"})
+        self.assertEqual(cache.load(str(self.dir), "k"), {"a": "ü"})
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["k.json"])
+
+    def test_corrupt_entries_are_a_miss(self):
+        for content in (b'{"a": 1', b"", b"\xff\xfe", b"[1, 2]"):
+            for backend in ("orjson", "stdlib"):
+                with self.subTest(content=content, backend=backend):
+                    (self.dir / "k.json").write_bytes(content)
+                    with patch.object(
+                        jsonlib, "orjson", jsonlib.orjson if backend == "orjson" else None
+                    ):
+                        self.assertIsNone(cache.load(str(self.dir), "k"))
+
+    def test_missing_entry_is_a_miss(self):
+        self.assertIsNone(cache.load(str(self.dir), "absent"))
+
+    def test_failed_replace_is_logged_and_cleans_up(self):
+        with patch("ai_module.cache.os.replace", side_effect=OSError("disk full")):
+            with self.assertLogs("ai_module.cache", level="WARNING"):
+                cache.store(str(self.dir), "k", {"a": 1})
+        self.assertEqual(list(self.dir.iterdir()), [])
+
+    def test_unwritable_cache_dir_is_logged(self):
+        # A regular file where the directory should be makes mkdir fail
+        blocker = self.dir / "blocker"
+        blocker.write_text("")
+        with self.assertLogs("ai_module.cache", level="WARNING"):
+            cache.store(str(blocker / "sub"), "k", {"a": 1})
+
+
+class InvokeTaskCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cfg = AIConfig().with_overrides(cache_dir=tmp.name, json_only=True)
+        self.provider = EchoProvider()
+        patcher = patch("ai_module.kernel.resolve_provider", return_value=self.provider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _invoke(self):
+        return asyncio.run(invoke_task(EchoTask(), {"q": "hi"}, self.cfg))
+
+    def test_second_call_is_served_from_cache(self):
+        self.assertEqual(self._invoke(), {"answer": 42})
+        self.assertEqual(self._invoke(), {"answer": 42})
+        self.assertEqual(self.provider.calls, 1)
+
+    def test_corrupt_entry_is_refetched_and_rewritten(self):
+        self._invoke()
+        (entry,) = Path(self.cfg.cache_dir).iterdir()
+        entry.write_bytes(b'{"answer": ')
+
+        with self.assertLogs("ai_module.cache", level="WARNING"):
+            self.assertEqual(self._invoke(), {"answer": 42})
+        self.assertEqual(self.provider.calls, 2)
+        self.assertEqual(cache.load(self.cfg.cache_dir, entry.stem), {"answer": 42})
+
+    def test_store_failure_still_returns_result(self):
+        with patch("ai_module.cache.os.replace", side_effect=OSError("read-only")):
+            with self.assertLogs("ai_module.cache", level="WARNING"):
+                self.assertEqual(self._invoke(), {"answer": 42})
+
+
+if __name__ == "__main__":
+    unittest.main()
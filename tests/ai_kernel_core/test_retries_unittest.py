@@ -0,0 +1,103 @@
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from ai_module.config import AIConfig
+from ai_module.kernel import MAX_BACKOFF, _chat_with_retries
+from ai_module.providers.base import ProviderError
+
+
+class StatusError(Exception):
+    """SDK-style API error carrying an HTTP status and response headers."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class FlakyProvider:
+    """Raises the given exceptions (wrapped as ProviderError) before succeeding."""
+
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    async def chat(self, messages, cfg):
+        self.calls += 1
+        if self.failures:
+            exc = self.failures.pop(0)
+            raise ProviderError.from_exception("Fake API error", exc) from exc
+        return "ok"
+
+
+class ClassificationTests(unittest.TestCase):
+    def test_transport_errors_are_retryable(self):
+        for exc in (
+            httpx.ConnectError("refused"),
+            asyncio.TimeoutError(),
+            ConnectionResetError(),
+        ):
+            self.assertTrue(ProviderError.from_exception("x", exc).retryable, exc)
+
+    def test_plain_bugs_are_not_retryable(self):
+        for exc in (TypeError("bad arg"), KeyError("k"), ValueError("v")):
+            self.assertFalse(ProviderError.from_exception("x", exc).retryable, exc)
+
+    def test_status_codes(self):
+        self.assertTrue(ProviderError.from_exception("x", StatusError(429)).retryable)
+        self.assertTrue(ProviderError.from_exception("x", StatusError(503)).retryable)
+        self.assertFalse(ProviderError.from_exception("x", StatusError(400)).retryable)
+        self.assertFalse(ProviderError.from_exception("x", StatusError(401)).retryable)
+
+
+class ChatWithRetriesTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("ai_module.kernel.asyncio.sleep", new_callable=AsyncMock)
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cfg = AIConfig(provider="fake", max_retries=2)
+
+    def _run(self, provider):
+        return asyncio.run(_chat_with_retries(provider, [], self.cfg))
+
+    def test_retries_transient_errors_then_succeeds(self):
+        provider = FlakyProvider(httpx.ReadTimeout("slow"), StatusError(502))
+        self.assertEqual(self._run(provider), "ok")
+        self.assertEqual(provider.calls, 3)
+        self.assertEqual(self.sleep.await_count, 2)
+
+    def test_non_retryable_error_fails_immediately(self):
+        provider = FlakyProvider(TypeError("bug"))
+        with self.assertRaises(ProviderError):
+            self._run(provider)
+        self.assertEqual(provider.calls, 1)
+        self.sleep.assert_not_awaited()
+
+    def test_gives_up_after_max_retries(self):
+        provider = FlakyProvider(*[StatusError(503)] * 5)
+        with self.assertRaises(ProviderError):
+            self._run(provider)
+        self.assertEqual(provider.calls, self.cfg.max_retries + 1)
+
+    def test_retry_after_is_honored_and_capped(self):
+        provider = FlakyProvider(
+            StatusError(429, {"retry-after": "3"}),
+            StatusError(429, {"retry-after": "999"}),
+        )
+        self._run(provider)
+        delays = [call.args[0] for call in self.sleep.await_args_list]
+        self.assertEqual(delays, [3.0, MAX_BACKOFF])
+
+
+if __name__ == "__main__":
+    unittest.main()
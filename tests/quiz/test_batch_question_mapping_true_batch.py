@@ -10,11 +10,13 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 django.setup()
 
 import asyncio
+import io
 import unittest
 from unittest.mock import AsyncMock, patch
 
 from ai_module.config import AIConfig
 from ai_module.kernel import invoke
+from quiz.management.commands.create_question_graph import Command
 from quiz.services.batch_question_mapping_service import BatchQuestionMappingService
 
 
@@ -148,6 +150,91 @@ class TestTrueBatchQuestionMapping(unittest.TestCase):
             self.assertEqual(len(result), 1)
             self.assertEqual(result[0]["question"], "Valid question?")
 
+    def test_batch_mapping_matches_by_question_index(self):
+        """Test that mappings are matched by question_index, not response order."""
+
+        mock_ai_response = {
+            "mappings": [
+                {
+                    "question_index": 2,
+                    "question_knowledge_ids": [2],
+                    "choices": [],
+                },
+                {
+                    "question_index": 7,  # Unknown index: ignored
+                    "question_knowledge_ids": [9],
+                    "choices": [],
+                },
+                {
+                    "question_index": 1,
+                    "question_knowledge_ids": [1],
+                    "choices": [],
+                },
+            ]
+        }
+
+        with patch(
+            "quiz.services.batch_question_mapping_service.invoke",
+            new=AsyncMock(return_value=mock_ai_response),
+        ):
+            service_input = {
+                "questions": [
+                    {
+                        "question": "First?",
+                        "choices": [{"index": 1, "text": "A"}, {"index": 2, "text": "B"}],
+                    },
+                    {
+                        "question": "Second?",
+                        "choices": [{"index": 1, "text": "C"}, {"index": 2, "text": "D"}],
+                    },
+                ],
+                "knowledge_nodes": [{"id": 1, "name": "Test"}],
+            }
+
+            result = BatchQuestionMappingService.execute(service_input)
+
+            self.assertEqual(
+                [(r["question"], r["question_knowledge_ids"]) for r in result],
+                [("Second?", [2]), ("First?", [1])],
+            )
+
+
+class TestCommandCorrectAnswers(unittest.TestCase):
+    """Test that correct_answers from the input file reach the mapped choices."""
+
+    def test_process_batch_marks_correct_string_choices(self):
+        mock_ai_response = {
+            "mappings": [
+                {
+                    "question_index": 1,
+                    "question_knowledge_ids": [1],
+                    "choices": [{"knowledge_ids": [1]}, {"knowledge_ids": []}],
+                }
+            ]
+        }
+        items = [
+            {
+                "question": "Which is a verb?",
+                "choices": ["Run", "Table"],
+                "correct_answers": [" run "],
+            }
+        ]
+        command = Command(stdout=io.StringIO(), stderr=io.StringIO())
+
+        with patch(
+            "quiz.services.batch_question_mapping_service.invoke",
+            new=AsyncMock(return_value=mock_ai_response),
+        ):
+            result = command._process_batch(
+                items,
+                [{"id": 1, "name": "Verbs"}],
+                {"batch_size": 10, "parallelism": 1, "rps": 0},
+            )
+
+        self.assertEqual(
+            [c["is_correct"] for c in result[0]["choices"]], [True, False]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+"""
+Test for chunked Neo4j writes in the create_question_graph command.
+"""
+
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import io
+import unittest
+from unittest.mock import patch
+
+from quiz.management.commands.create_question_graph import Command
+
+
+def _mapping(question):
+    return {
+        "question": question,
+        "choices": [{"text": "a", "is_correct": True, "knowledge_ids": []}],
+        "question_knowledge_ids": [],
+    }
+
+
+class TestWriteToNeo4j(unittest.TestCase):
+    """Test that a failing chunk doesn't abort the whole write."""
+
+    def setUp(self):
+        self.command = Command(stdout=io.StringIO(), stderr=io.StringIO())
+        patcher = patch("quiz.management.commands.create_question_graph.db")
+        self.mock_db = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        def create_question_graph(question_text, **kwargs):
+            if question_text == "bad":
+                raise RuntimeError("boom")
+            return {}
+
+        patcher = patch(
+            "quiz.management.commands.create_question_graph."
+            "Neo4jQuizService.create_question_graph",
+            side_effect=create_question_graph,
+        )
+        self.mock_create = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, workers):
+        mappings = [_mapping("q1"), _mapping("q2"), _mapping("bad"), _mapping("q4")]
+        return self.command._write_to_neo4j(
+            mappings, {"write_batch_size": 2, "write_workers": workers}
+        )
+
+    def test_failing_chunk_reports_partial_counts(self):
+        """Test that other chunks are written and the failed one is counted."""
+        written, failed = self._write(workers=1)
+
+        self.assertEqual((written, failed), (2, 2))
+        self.assertIn("Write chunk 2", self.command.stdout.getvalue())
+        # Sequential writes stay on the caller's connection
+        self.mock_db.close_connection.assert_not_called()
+
+    def test_failing_chunk_with_workers_closes_drivers(self):
+        """Test the threaded path: partial counts and per-thread driver cleanup."""
+        written, failed = self._write(workers=2)
+
+        self.assertEqual((written, failed), (2, 2))
+        self.assertEqual(self.mock_db.close_connection.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test for the knowledge node fetch cache in QuestionKnowledgeMappingService.
+"""
+
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import unittest
+from unittest.mock import patch
+
+from quiz.services import question_knowledge_mapping_service as qkms
+from quiz.services.question_knowledge_mapping_service import (
+    QuestionKnowledgeMappingService,
+    invalidate_knowledge_cache,
+)
+
+
+class TestKnowledgeNodeCache(unittest.TestCase):
+    """Test caching of _fetch_knowledge_nodes results."""
+
+    def setUp(self):
+        invalidate_knowledge_cache()
+        self.addCleanup(invalidate_knowledge_cache)
+        self.service = QuestionKnowledgeMappingService(inp={})
+        patcher = patch.object(
+            QuestionKnowledgeMappingService,
+            "_query_knowledge_nodes",
+            return_value=[{"id": 1, "element_id": "4:abc:1", "name": "Tenses"}],
+        )
+        self.mock_query = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_fetch_hits_cache(self):
+        """Test that the same labels/limit only query Neo4j once."""
+        first = self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        second = self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+
+        self.assertEqual(first, second)
+        self.mock_query.assert_called_once()
+
+    def test_different_limit_is_separate_entry(self):
+        """Test that the cache is keyed by limit as well as labels."""
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        self.service._fetch_knowledge_nodes(["Knowledge"], 10)
+
+        self.assertEqual(self.mock_query.call_count, 2)
+
+    def test_invalidate_and_expiry_refetch(self):
+        """Test that invalidation and TTL expiry both force a new query."""
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        invalidate_knowledge_cache()
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        self.assertEqual(self.mock_query.call_count, 2)
+
+        with patch.object(qkms, "KNOWLEDGE_CACHE_TTL", 0):
+            self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        self.assertEqual(self.mock_query.call_count, 3)
+
+    def test_empty_result_not_cached(self):
+        """Test that an empty (likely failed) fetch is retried next time."""
+        self.mock_query.return_value = []
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+
+        self.assertEqual(self.mock_query.call_count, 2)
+
+    def test_knowledge_save_and_delete_invalidate(self):
+        """Test that Knowledge model write hooks clear the cache."""
+        from knowledge.neo_models import Knowledge
+
+        self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+        for calls, hook in enumerate((Knowledge.post_save, Knowledge.post_delete), 2):
+            hook(Knowledge(name="Tenses"))
+            self.service._fetch_knowledge_nodes(["Knowledge"], 400)
+            self.assertEqual(self.mock_query.call_count, calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,185 +10,176 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 django.setup()
 
 import unittest
-from unittest.mock import MagicMock, patch
-
-from quiz.services.neo4j_quiz_service import Neo4jQuizService
-
-
-class TestQuizMerge(unittest.TestCase):
-    """Test the quiz merge functionality."""
-
-    def test_create_new_quiz(self):
-        """Test creating a new quiz when none exists."""
-
-        # Mock the Quiz model (patch where it's imported)
-        with patch("quiz.neo_models.Quiz") as MockQuiz:
-            # Setup: no existing quiz
-            MockQuiz.nodes.filter.return_value.first.return_value = None
-
-            # Create a mock quiz instance
-            mock_quiz = MagicMock()
-            mock_quiz.element_id = "4:abc:123"
-            mock_quiz.has_choice.all.return_value = []
-            mock_quiz.related_to.all.return_value = []
-            MockQuiz.return_value.save.return_value = mock_quiz
-
-            # Mock Choice
-            with patch("quiz.neo_models.Choice") as MockChoice:
-                mock_choice = MagicMock()
-                mock_choice.element_id = "4:def:456"
-                mock_choice.related_to.all.return_value = []
-                MockChoice.return_value.save.return_value = mock_choice
-
-                # Mock Knowledge
-                with patch("knowledge.neo_models.Knowledge"):
-                    result = Neo4jQuizService.create_question_graph(
-                        question_text="What is 2+2?",
-                        choices=[
-                            {
-                                "text": "3",
-                                "is_correct": False,
-                                "knowledge_ids": [],
-                            },
-                            {
-                                "text": "4",
-                                "is_correct": True,
-                                "knowledge_ids": [],
-                            },
-                        ],
-                    )
-
-                    # Verify new quiz was created
-                    self.assertTrue(result["is_new"])
-                    self.assertEqual(result["quiz_text"], "What is 2+2?")
-                    self.assertEqual(result["choices_count"], 2)
-
-    def test_merge_existing_quiz(self):
-        """Test merging when quiz with same quiz_text exists."""
-
-        with patch("quiz.neo_models.Quiz") as MockQuiz:
-            # Setup: existing quiz found
-            existing_quiz = MagicMock()
-            existing_quiz.element_id = "4:abc:123"
-            existing_quiz.has_choice.all.return_value = []
-            existing_quiz.related_to.all.return_value = []
-
-            MockQuiz.nodes.filter.return_value.first.return_value = existing_quiz
-
-            with patch("quiz.neo_models.Choice") as MockChoice:
-                mock_choice = MagicMock()
-                mock_choice.element_id = "4:def:456"
-                mock_choice.related_to.all.return_value = []
-                MockChoice.return_value.save.return_value = mock_choice
-
-                with patch("knowledge.neo_models.Knowledge"):
-                    result = Neo4jQuizService.create_question_graph(
-                        question_text="What is 2+2?",
-                        choices=[
-                            {
-                                "text": "4",
-                                "is_correct": True,
-                                "knowledge_ids": [],
-                            },
-                        ],
-                    )
-
-                    # Verify quiz was merged (not created)
-                    self.assertFalse(result["is_new"])
-                    self.assertEqual(result["quiz_element_id"], "4:abc:123")
-
-                    # Verify Quiz() constructor was NOT called (existing quiz used)
-                    MockQuiz.assert_not_called()
-
-    def test_merge_existing_choice(self):
+import uuid
+from unittest.mock import patch
+
+from neomodel import db
+
+from quiz.services.neo4j_quiz_service import (
+    CREATE_QUESTION_GRAPH_QUERY,
+    Neo4jQuizService,
+)
+
+
+class TestQuizMergeQuery(unittest.TestCase):
+    """Test the query and parameters sent by create_question_graph."""
+
+    def setUp(self):
+        patcher = patch("quiz.services.neo4j_quiz_service.db.cypher_query")
+        self.mock_query = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_query.return_value = ([["4:abc:123", True, []]], None)
+
+    def _create(self, choices, question_knowledge_ids=None):
+        Neo4jQuizService.create_question_graph(
+            question_text="What is 2+2?",
+            choices=choices,
+            question_knowledge_ids=question_knowledge_ids,
+        )
+        self.mock_query.assert_called_once()
+        query, params = self.mock_query.call_args[0]
+        self.assertEqual(query, CREATE_QUESTION_GRAPH_QUERY)
+        return params
+
+    def test_quiz_merged_by_text_without_marker_write(self):
+        """Test that quizzes MERGE on quiz_text and is_new needs no extra write."""
+        query = " ".join(CREATE_QUESTION_GRAPH_QUERY.split())
+
+        self.assertIn("MERGE (q:Quiz {quiz_text: $question_text})", query)
+        self.assertIn(
+            "OPTIONAL MATCH (existing:Quiz {quiz_text: $question_text})", query
+        )
+        self.assertNotIn("REMOVE", query)
+        self.assertNotIn("_is_new", query)
+
+    def test_choices_merged_through_quiz(self):
+        """Test that choices are only reused when they belong to this quiz."""
+        query = " ".join(CREATE_QUESTION_GRAPH_QUERY.split())
+
+        self.assertIn(
+            "MERGE (q)-[:HAS_CHOICE]->(ch:Choice {choice_text: c.text})", query
+        )
+        # Null-safe change detection: a null stored value must not block updates
+        self.assertIn("coalesce(ch.is_correct = c.is_correct, false)", query)
+        self.assertNotIn("<>", query)
+
+    def test_correct_flags_and_explanations_sent(self):
+        """Test that correctness and explanations are normalized into params."""
+        params = self._create(
+            [
+                {"text": "3", "is_correct": None, "answer_description": None},
+                {"text": "4", "is_correct": True, "answer_description": "2+2=4"},
+            ]
+        )
+
+        self.assertEqual(
+            [
+                (c["text"], c["is_correct"], c["answer_explanation"])
+                for c in params["choices"]
+            ],
+            [("3", False, ""), ("4", True, "2+2=4")],
+        )
+
+    def test_knowledge_ids_filtered_and_deduplicated(self):
+        """Test that non-integer and duplicate knowledge ids are dropped."""
+        params = self._create(
+            [
+                {"text": "", "is_correct": False, "knowledge_ids": [5]},
+                {"text": "4", "is_correct": True, "knowledge_ids": [2, "bad", 2, 3]},
+            ],
+            question_knowledge_ids=[1, 1, "x"],
+        )
+
+        self.assertEqual(params["question_text"], "What is 2+2?")
+        self.assertEqual(params["question_knowledge_ids"], [1])
+        # Empty-text choices are skipped entirely
+        self.assertEqual(len(params["choices"]), 1)
+        self.assertEqual(params["choices"][0]["knowledge_ids"], [2, 3])
+
+
+def _neo4j_available() -> bool:
+    try:
+        db.cypher_query("RETURN 1")
+        return True
+    except Exception:
+        return False
+
+
+class TestQuizMergeIntegration(unittest.TestCase):
+    """Run the merge query against a real Neo4j (skipped when none is reachable)."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not _neo4j_available():
+            raise unittest.SkipTest("Neo4j is not reachable")
+
+    def setUp(self):
+        self.question = f"[test {uuid.uuid4()}] What is 2+2?"
+        self.addCleanup(
+            db.cypher_query,
+            "MATCH (q:Quiz {quiz_text: $text}) "
+            "OPTIONAL MATCH (q)-[:HAS_CHOICE]->(ch:Choice) "
+            "DETACH DELETE q, ch",
+            {"text": self.question},
+        )
+
+    def _create(self, *choices):
+        return Neo4jQuizService.create_question_graph(
+            question_text=self.question,
+            choices=[
+                {"text": text, "is_correct": is_correct, "knowledge_ids": []}
+                for text, is_correct in choices
+            ],
+        )
+
+    def test_create_then_merge_existing_quiz(self):
+        """Test that a second write merges into the quiz created by the first."""
+        created = self._create(("3", False), ("4", True))
+        merged = self._create(("4", True))
+
+        self.assertTrue(created["is_new"])
+        self.assertFalse(merged["is_new"])
+        self.assertEqual(merged["quiz_element_id"], created["quiz_element_id"])
+
+    def test_merge_existing_choice_updates_correct_flag(self):
         """Test that existing choices are updated, not duplicated."""
-
-        with patch("quiz.neo_models.Quiz") as MockQuiz:
-            # Setup: existing quiz with existing choice
-            existing_choice = MagicMock()
-            existing_choice.choice_text = "4"
-            existing_choice.is_correct = False  # Will be updated to True
-            existing_choice.element_id = "4:choice:789"
-            existing_choice.related_to.all.return_value = []
-
-            existing_quiz = MagicMock()
-            existing_quiz.element_id = "4:abc:123"
-            existing_quiz.has_choice.all.return_value = [existing_choice]
-            existing_quiz.related_to.all.return_value = []
-
-            MockQuiz.nodes.filter.return_value.first.return_value = existing_quiz
-
-            with patch("quiz.neo_models.Choice") as MockChoice:
-                with patch("knowledge.neo_models.Knowledge"):
-                    result = Neo4jQuizService.create_question_graph(
-                        question_text="What is 2+2?",
-                        choices=[
-                            {
-                                "text": "4",  # Same choice text
-                                "is_correct": True,  # Updated value
-                                "knowledge_ids": [],
-                            },
-                        ],
-                    )
-
-                    # Verify existing choice was updated
-                    self.assertTrue(existing_choice.is_correct)
-                    existing_choice.save.assert_called_once()
-
-                    # Verify new Choice was NOT created
-                    MockChoice.assert_not_called()
-
-                    # Verify result includes the existing choice
-                    self.assertEqual(result["choices_count"], 1)
-                    self.assertEqual(result["choices"][0]["element_id"], "4:choice:789")
+        first = self._create(("4", False))
+        second = self._create(("4", True))
+
+        self.assertEqual(
+            second["choices"][0]["element_id"], first["choices"][0]["element_id"]
+        )
+        self.assertTrue(second["choices"][0]["is_correct"])
+        rows, _ = db.cypher_query(
+            "MATCH (:Quiz {quiz_text: $text})-[:HAS_CHOICE]->(ch) RETURN count(ch)",
+            {"text": self.question},
+        )
+        self.assertEqual(rows[0][0], 1)
+
+    def test_null_stored_values_are_updated(self):
+        """Test that a choice with null is_correct/explanation gets rewritten."""
+        self._create(("4", True))
+        db.cypher_query(
+            "MATCH (:Quiz {quiz_text: $text})-[:HAS_CHOICE]->(ch) "
+            "SET ch.is_correct = null, ch.answer_explanation = null",
+            {"text": self.question},
+        )
+
+        result = self._create(("4", True))
+
+        self.assertTrue(result["choices"][0]["is_correct"])
+        self.assertEqual(result["choices"][0]["answer_explanation"], "")
 
     def test_add_new_choice_to_existing_quiz(self):
-        """Test adding a new choice to an existing quiz."""
-
-        with patch("quiz.neo_models.Quiz") as MockQuiz:
-            # Setup: existing quiz with one choice
-            existing_choice = MagicMock()
-            existing_choice.choice_text = "3"
-            existing_choice.element_id = "4:choice:111"
-            existing_choice.related_to.all.return_value = []
-
-            existing_quiz = MagicMock()
-            existing_quiz.element_id = "4:abc:123"
-            existing_quiz.has_choice.all.return_value = [existing_choice]
-            existing_quiz.related_to.all.return_value = []
-
-            MockQuiz.nodes.filter.return_value.first.return_value = existing_quiz
-
-            with patch("quiz.neo_models.Choice") as MockChoice:
-                # New choice to be created
-                new_choice = MagicMock()
-                new_choice.element_id = "4:choice:222"
-                new_choice.related_to.all.return_value = []
-                MockChoice.return_value.save.return_value = new_choice
-
-                with patch("knowledge.neo_models.Knowledge"):
-                    result = Neo4jQuizService.create_question_graph(
-                        question_text="What is 2+2?",
-                        choices=[
-                            {
-                                "text": "3",  # Existing choice
-                                "is_correct": False,
-                                "knowledge_ids": [],
-                            },
-                            {
-                                "text": "4",  # New choice
-                                "is_correct": True,
-                                "knowledge_ids": [],
-                            },
-                        ],
-                    )
-
-                    # Verify both choices are in result
-                    self.assertEqual(result["choices_count"], 2)
-
-                    # Verify new choice was created
-                    MockChoice.assert_called_once()
-                    existing_quiz.has_choice.connect.assert_called_once_with(new_choice)
+        """Test adding a new choice to an existing quiz keeps the old one."""
+        first = self._create(("3", False))
+        second = self._create(("3", False), ("4", True))
+
+        self.assertEqual(second["choices_count"], 2)
+        self.assertIn(
+            first["choices"][0]["element_id"],
+            [c["element_id"] for c in second["choices"]],
+        )
 
 
 if __name__ == "__main__":
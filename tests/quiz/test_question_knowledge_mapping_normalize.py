@@ -0,0 +1,82 @@
+"""
+Test for QuestionKnowledgeMappingService mapping normalization.
+"""
+
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import unittest
+from unittest.mock import patch
+
+from quiz.services.question_knowledge_mapping_service import (
+    QuestionKnowledgeMappingService,
+)
+
+
+class TestNormalizeMapping(unittest.TestCase):
+    """Test _normalize_mapping output structure."""
+
+    def setUp(self):
+        self.service = QuestionKnowledgeMappingService(inp={})
+
+    def test_correct_answers_ignore_case_and_whitespace(self):
+        """Test that correct answers match choices regardless of case/padding."""
+        result = self.service._normalize_mapping(
+            mapping={"question_knowledge_ids": [], "choices": []},
+            question="Pick the verb",
+            choices=["Run", "table"],
+            correct_answers=[" run "],
+        )
+
+        self.assertEqual(
+            [c["is_correct"] for c in result["choices"]], [True, False]
+        )
+
+    def test_non_numeric_ids_are_skipped(self):
+        """Test that ids the AI returns that aren't numeric are dropped."""
+        result = self.service._normalize_mapping(
+            mapping={
+                "question_knowledge_ids": ["7", "x", None],
+                "choices": [{"index": 1, "knowledge_ids": [3, "bad"]}],
+            },
+            question="Pick the verb",
+            choices=["run", "table"],
+            correct_answers=["run"],
+        )
+
+        self.assertEqual(result["question_knowledge_ids"], [7])
+        self.assertEqual(result["choices"][0]["knowledge_ids"], [3])
+        self.assertEqual(result["choices"][1]["knowledge_ids"], [])
+
+
+class TestEmptyKnowledgeNodes(unittest.TestCase):
+    """Test that run() skips the AI call when there is nothing to map to."""
+
+    def test_no_knowledge_nodes_skips_ai(self):
+        service = QuestionKnowledgeMappingService(
+            inp={
+                "question": "Pick the verb",
+                "choices": ["run", "table"],
+                "correct_answers": ["run"],
+                "knowledge_nodes": [],
+            }
+        )
+        with patch.object(
+            QuestionKnowledgeMappingService, "_generate_mapping"
+        ) as mock_generate:
+            result = service.run()
+
+        mock_generate.assert_not_called()
+        self.assertEqual(result["question_knowledge_ids"], [])
+        self.assertEqual(
+            [(c["index"], c["knowledge_ids"], c["is_correct"]) for c in result["choices"]],
+            [(1, [], True), (2, [], False)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
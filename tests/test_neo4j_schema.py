@@ -0,0 +1,103 @@
+"""
+Tests that the constraints and indexes declared on the neomodel classes are
+installed by `manage.py install_labels`.
+"""
+
+import io
+import os
+import django
+
+# Setup Django settings before importing anything else
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+django.setup()
+
+import unittest
+from unittest.mock import patch
+
+from django.core.management import call_command
+from neomodel import db
+
+
+def _install_labels_queries():
+    """Run install_labels against a mocked driver and return its Cypher."""
+    with patch.object(db, "cypher_query", return_value=([], None)) as mock_query:
+        call_command("install_labels", stdout=io.StringIO())
+    return [" ".join(c.args[0].split()) for c in mock_query.call_args_list]
+
+
+def _neo4j_available() -> bool:
+    try:
+        db.cypher_query("RETURN 1")
+        return True
+    except Exception:
+        return False
+
+
+class TestInstallLabels(unittest.TestCase):
+    """Test the schema statements install_labels issues."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.queries = _install_labels_queries()
+
+    def test_quiz_text_unique_constraint(self):
+        """Test that Quiz.quiz_text gets a unique constraint."""
+        self.assertIn(
+            "CREATE CONSTRAINT constraint_unique_Quiz_quiz_text "
+            "FOR (n:Quiz) REQUIRE n.quiz_text IS UNIQUE",
+            self.queries,
+        )
+
+    def test_quiz_text_has_no_separate_index(self):
+        """Test that quiz_text lookups rely on the constraint's backing index."""
+        self.assertFalse(
+            [q for q in self.queries if q.startswith("CREATE INDEX index_Quiz_")]
+        )
+
+    def test_student_lookup_indexes(self):
+        """Test that Student.username and Student.db_id get range indexes."""
+        for prop in ("username", "db_id"):
+            self.assertIn(
+                f"CREATE INDEX index_Student_{prop} FOR (n:Student) ON (n.{prop});",
+                self.queries,
+            )
+
+
+class TestInstalledSchema(unittest.TestCase):
+    """Check the live schema (skipped when no Neo4j is reachable)."""
+
+    @classmethod
+    def setUpClass(cls):
+        if not _neo4j_available():
+            raise unittest.SkipTest("Neo4j is not reachable")
+        call_command("install_labels", stdout=io.StringIO())
+
+    def test_quiz_text_constraint_exists(self):
+        """Test that the Quiz.quiz_text unique constraint is in the database."""
+        rows, _ = db.cypher_query(
+            "SHOW CONSTRAINTS YIELD type, labelsOrTypes, properties "
+            "WHERE type = 'UNIQUENESS' AND labelsOrTypes = ['Quiz'] "
+            "AND properties = ['quiz_text'] RETURN count(*)"
+        )
+        self.assertEqual(rows[0][0], 1)
+
+    def test_quiz_text_lookup_is_indexed(self):
+        """Test that MATCH/MERGE by quiz_text can use an index."""
+        rows, _ = db.cypher_query(
+            "SHOW INDEXES YIELD labelsOrTypes, properties "
+            "WHERE labelsOrTypes = ['Quiz'] AND properties = ['quiz_text'] "
+            "RETURN count(*)"
+        )
+        self.assertEqual(rows[0][0], 1)
+
+    def test_student_indexes_exist(self):
+        """Test that the Student lookup indexes are in the database."""
+        rows, _ = db.cypher_query(
+            "SHOW INDEXES YIELD labelsOrTypes, properties "
+            "WHERE labelsOrTypes = ['Student'] RETURN properties"
+        )
+        self.assertTrue({"username", "db_id"} <= {row[0][0] for row in rows})
+
+
+if __name__ == "__main__":
+    unittest.main()